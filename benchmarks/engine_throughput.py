@@ -0,0 +1,195 @@
+"""Match engine throughput (matches per second) across modes and workloads.
+
+Usage: python -m benchmarks.engine_throughput [--matches 2000]
+           [--squad-sizes 11 18 25] [--event-rates 0.05 0.1 0.2]
+           [--modes single compact event batch vectorized parallel] [--output results.json]
+
+Modes:
+- single: one ``MatchEngine`` per match, results discarded
+- compact: as single, with teams as ``logic.squad.Squad`` instead of dicts
+- event: as single, with ``logic.event_engine.EventDrivenMatchEngine``
+- batch: ``logic.simulation.simulate_fixtures`` with events
+- vectorized: ``logic.vectorized_engine.simulate_fixtures_vectorized``
+- parallel: ``simulate_fixtures`` chunks on a process pool
+
+Teams are generated in memory from ``--seed`` and every mode is seeded,
+so runs need no database or display and simulate identical workloads.
+Each measurement is the best of ``--repeats`` runs.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from logic import match_engine, vectorized_engine
+from logic.event_engine import EventDrivenMatchEngine
+from logic.match_engine import MatchEngine
+from logic.rng import match_rng, numpy_rng
+from logic.simulation import make_fixture, simulate_fixtures
+from logic.squad import Squad
+from logic.vectorized_engine import simulate_fixtures_vectorized
+
+TEAMS = 20
+MODES = ["single", "compact", "event", "batch", "vectorized", "parallel"]
+
+# Fixtures shipped once to each worker by the pool initializer
+_worker_fixtures = None
+
+
+def set_event_rate(rate: float):
+    """Set the per-minute event probability used by both engines"""
+    match_engine.EVENT_PROBABILITY = rate
+    vectorized_engine.EVENT_PROBABILITY = rate
+
+
+def make_fixtures(matches: int, squad_size: int, seed: int):
+    """``matches`` fixtures between ``TEAMS`` random teams of ``squad_size`` players"""
+    rng = random.Random(seed)
+    teams = []
+    for team_id in range(1, TEAMS + 1):
+        players = []
+        for number in range(squad_size):
+            base = rng.randint(45, 85)
+            players.append({
+                "id": team_id * 100 + number,
+                "name": f"Player {team_id}-{number}",
+                **{stat: max(1, min(99, base + rng.randint(-10, 10)))
+                   for stat in ("attack", "defense", "stamina", "speed", "technique")},
+            })
+        teams.append({"id": team_id, "name": f"Team {team_id}", "players": players})
+
+    fixtures = []
+    while len(fixtures) < matches:
+        home, away = rng.sample(teams, 2)
+        fixtures.append(make_fixture(home, away))
+    return fixtures
+
+
+def run_single(fixtures, seed, engine_class=MatchEngine):
+    for index, fixture in enumerate(fixtures):
+        engine_class(fixture["home_team"], fixture["away_team"], None, None,
+                     rng=match_rng(seed, index)).simulate_match()
+
+
+def compact_fixtures(fixtures):
+    """The same fixtures with every team converted to a ``Squad`` once"""
+    squads = {}
+    for fixture in fixtures:
+        for side in ("home_team", "away_team"):
+            team = fixture[side]
+            if team["id"] not in squads:
+                squads[team["id"]] = Squad.from_team_dict(team)
+    return [make_fixture(squads[fixture["home_team"]["id"]], squads[fixture["away_team"]["id"]])
+            for fixture in fixtures]
+
+
+def run_batch(fixtures, seed):
+    simulate_fixtures(fixtures, include_events=True, seed=seed)
+
+
+def run_vectorized(fixtures, seed):
+    simulate_fixtures_vectorized(fixtures, include_events=True, rng=numpy_rng(seed))
+
+
+def _init_worker(fixtures, event_rate):
+    global _worker_fixtures
+    _worker_fixtures = fixtures
+    set_event_rate(event_rate)
+
+
+def _run_chunk(seed, chunk):
+    # Only scores travel back, as in logic.season
+    results = simulate_fixtures(_worker_fixtures[chunk], include_events=True, seed=seed)
+    return [(result["home_score"], result["away_score"]) for result in results]
+
+
+def run_parallel(fixtures, seed, workers, event_rate):
+    chunk_size = max(1, len(fixtures) // (workers * 4))
+    chunks = [slice(start, start + chunk_size) for start in range(0, len(fixtures), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(fixtures, event_rate)) as executor:
+        list(executor.map(_run_chunk, [seed] * len(chunks), chunks))
+
+
+def measure(mode, fixtures, seed, workers, event_rate, repeats):
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        if mode in ("single", "compact"):
+            run_single(fixtures, seed)
+        elif mode == "event":
+            run_single(fixtures, seed, EventDrivenMatchEngine)
+        elif mode == "batch":
+            run_batch(fixtures, seed)
+        elif mode == "vectorized":
+            run_vectorized(fixtures, seed)
+        else:
+            run_parallel(fixtures, seed, workers, event_rate)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--matches", type=int, default=2000)
+    parser.add_argument("--squad-sizes", type=int, nargs="+", default=[11, 18, 25])
+    parser.add_argument("--event-rates", type=float, nargs="+", default=[0.05, 0.1, 0.2])
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    default_rate = match_engine.EVENT_PROBABILITY
+    results = []
+    try:
+        for squad_size in args.squad_sizes:
+            fixtures = make_fixtures(args.matches, squad_size, args.seed)
+            squad_fixtures = compact_fixtures(fixtures)
+            for event_rate in args.event_rates:
+                set_event_rate(event_rate)
+                for mode in args.modes:
+                    seconds = measure(mode, squad_fixtures if mode == "compact" else fixtures,
+                                      args.seed, args.workers, event_rate, args.repeats)
+                    results.append({
+                        "mode": mode,
+                        "squad_size": squad_size,
+                        "event_rate": event_rate,
+                        "matches": len(fixtures),
+                        "seconds": seconds,
+                        "matches_per_second": len(fixtures) / seconds,
+                    })
+    finally:
+        set_event_rate(default_rate)
+
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "parameters": {
+            key: value for key, value in vars(args).items() if key != "output"
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+            output.write("\n")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""Statistical equivalence and speed of the event-driven match engine.
+
+Usage: python -m benchmarks.event_engine [--matches 20000] [--squad-size 18]
+           [--event-rate 0.1] [--alpha 0.001] [--seed 0]
+
+Plays the same in-memory fixtures with ``MatchEngine`` and
+``EventDrivenMatchEngine`` from independent seeds and compares:
+
+- mean goals and shots per side and events per match (Welch z-test)
+- total goals per match and event minutes in 10-minute buckets
+  (chi-square test of homogeneity)
+
+Prints every statistic with its p-value, random draws per match and
+matches per second for both engines as JSON. The exit status is 1 if any
+p-value falls below ``--alpha``.
+"""
+import argparse
+import json
+import math
+import random
+import sys
+import time
+
+from benchmarks.engine_throughput import make_fixtures, set_event_rate
+from logic import match_engine
+from logic.event_engine import EventDrivenMatchEngine
+from logic.match_engine import MATCH_MINUTES, MatchEngine
+from logic.rng import match_rng
+
+ENGINES = {"minute": MatchEngine, "event": EventDrivenMatchEngine}
+MEANS = ("home_goals", "away_goals", "home_shots", "away_shots", "events")
+MAX_GOALS = 8  # Totals above this share the last bucket
+MINUTE_BUCKET = 10
+
+
+class CountingRandom(random.Random):
+    """``random.Random`` that counts the draws an engine makes"""
+
+    def __init__(self, seed):
+        self.draws = 0
+        super().__init__(seed)
+
+    def random(self):
+        self.draws += 1
+        return super().random()
+
+    def getrandbits(self, k):
+        # Used by choice() when picking scorers
+        self.draws += 1
+        return super().getrandbits(k)
+
+
+def play(engine_class, fixtures, seed):
+    """Per-match statistics, event minutes and draws of one engine"""
+    matches = []
+    minutes = []
+    draws = 0
+    for index, fixture in enumerate(fixtures):
+        rng = CountingRandom(match_rng(seed, index).getrandbits(64))
+        engine = engine_class(fixture["home_team"], fixture["away_team"], None, None, rng=rng)
+        engine.simulate_match()
+        matches.append({
+            "home_goals": engine.home_score,
+            "away_goals": engine.away_score,
+            "home_shots": engine.shots["home"],
+            "away_shots": engine.shots["away"],
+            "events": len(engine.events),
+        })
+        minutes.extend(event["minute"] for event in engine.events)
+        draws += rng.draws
+    return matches, minutes, draws
+
+
+def throughput(engine_class, fixtures, seed, repeats=3):
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for index, fixture in enumerate(fixtures):
+            engine_class(fixture["home_team"], fixture["away_team"], None, None,
+                         rng=match_rng(seed, index)).simulate_match()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(fixtures) / best
+
+
+def normal_p(z: float) -> float:
+    """Two-sided p-value of a standard normal statistic"""
+    return math.erfc(abs(z) / math.sqrt(2))
+
+
+def chi_square_p(statistic: float, df: int) -> float:
+    """Upper tail of the chi-square distribution (Wilson-Hilferty approximation)"""
+    if df <= 0:
+        return 1.0
+    z = ((statistic / df) ** (1 / 3) - (1 - 2 / (9 * df))) / math.sqrt(2 / (9 * df))
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def welch(a, b):
+    mean_a, mean_b = sum(a) / len(a), sum(b) / len(b)
+    var_a = sum((x - mean_a) ** 2 for x in a) / (len(a) - 1)
+    var_b = sum((x - mean_b) ** 2 for x in b) / (len(b) - 1)
+    error = math.sqrt(var_a / len(a) + var_b / len(b))
+    z = (mean_a - mean_b) / error if error else 0.0
+    return {"minute": mean_a, "event": mean_b, "z": z, "p": normal_p(z)}
+
+
+def homogeneity(counts_a, counts_b):
+    """Chi-square test that two histograms share one distribution"""
+    total_a, total_b = sum(counts_a), sum(counts_b)
+    statistic = 0.0
+    df = -1
+    for a, b in zip(counts_a, counts_b):
+        if a + b == 0:
+            continue
+        df += 1
+        for observed, total in ((a, total_a), (b, total_b)):
+            expected = (a + b) * total / (total_a + total_b)
+            statistic += (observed - expected) ** 2 / expected
+    return {"minute": counts_a, "event": counts_b, "chi2": statistic, "df": df,
+            "p": chi_square_p(statistic, df)}
+
+
+def histogram(values, buckets, bucket_of):
+    counts = [0] * buckets
+    for value in values:
+        counts[bucket_of(value)] += 1
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--matches", type=int, default=20000)
+    parser.add_argument("--squad-size", type=int, default=18)
+    parser.add_argument("--event-rate", type=float, default=match_engine.EVENT_PROBABILITY)
+    parser.add_argument("--alpha", type=float, default=0.001,
+                        help="fail if any p-value is below this")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    fixtures = make_fixtures(args.matches, args.squad_size, args.seed)
+    default_rate = match_engine.EVENT_PROBABILITY
+    set_event_rate(args.event_rate)
+    try:
+        # Independent seeds, so equal results are not just shared draws
+        played = {name: play(engine_class, fixtures, args.seed + offset)
+                  for offset, (name, engine_class) in enumerate(ENGINES.items())}
+        speed = {name: throughput(engine_class, fixtures, args.seed)
+                 for name, engine_class in ENGINES.items()}
+    finally:
+        set_event_rate(default_rate)
+
+    (minute_matches, minute_minutes, minute_draws), (event_matches, event_minutes, event_draws) = (
+        played["minute"], played["event"])
+    tests = {
+        f"mean_{key}": welch([match[key] for match in minute_matches],
+                             [match[key] for match in event_matches])
+        for key in MEANS
+    }
+    goals_bucket = lambda match: min(match["home_goals"] + match["away_goals"], MAX_GOALS)
+    tests["total_goals"] = homogeneity(histogram(minute_matches, MAX_GOALS + 1, goals_bucket),
+                                       histogram(event_matches, MAX_GOALS + 1, goals_bucket))
+    minute_buckets = math.ceil(MATCH_MINUTES / MINUTE_BUCKET)
+    minute_bucket = lambda minute: (minute - 1) // MINUTE_BUCKET
+    tests["event_minutes"] = homogeneity(histogram(minute_minutes, minute_buckets, minute_bucket),
+                                         histogram(event_minutes, minute_buckets, minute_bucket))
+
+    passed = all(test["p"] >= args.alpha for test in tests.values())
+    json.dump({
+        "parameters": vars(args),
+        "passed": passed,
+        "tests": tests,
+        "draws_per_match": {"minute": minute_draws / len(fixtures),
+                            "event": event_draws / len(fixtures)},
+        "matches_per_second": speed,
+    }, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
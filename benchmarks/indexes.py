@@ -0,0 +1,123 @@
+"""Measure the effect of the query indexes on a large synthetic database.
+
+Usage: python -m benchmarks.indexes [--players 100000] [--events 1000000]
+
+Builds a throw-away database, times the application's hot queries with all
+secondary indexes dropped, then again after ``ensure_indexes``.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import insert, select, text
+
+from database import models
+from database.models import Base, Player, Team, TeamTactics, Match, MatchEvent
+
+PLAYERS_PER_TEAM = 25
+EVENTS_PER_MATCH = 10
+POSITIONS = ["Forward", "Midfielder", "Defender", "Goalkeeper"]
+
+
+def populate(engine, players: int, events: int):
+    rng = random.Random(0)
+    teams = max(1, players // PLAYERS_PER_TEAM)
+    matches = max(1, events // EVENTS_PER_MATCH)
+    start_date = date(2020, 1, 1)
+
+    with engine.begin() as connection:
+        connection.execute(insert(Team), [
+            {"id": i, "name": f"Team {i}", "country": "Nowhere", "league": "League", "budget": 1e6}
+            for i in range(1, teams + 1)
+        ])
+        connection.execute(insert(TeamTactics), [
+            {"team_id": i, "name": "Default", "formation": "4-4-2"} for i in range(1, teams + 1)
+        ])
+        connection.execute(insert(Player), [
+            {"id": i, "name": f"Player {i}", "position": rng.choice(POSITIONS),
+             "team_id": (i - 1) // PLAYERS_PER_TEAM + 1, "attack": 50, "defense": 50,
+             "stamina": 50, "speed": 50, "technique": 50}
+            for i in range(1, players + 1)
+        ])
+        connection.execute(insert(Match), [
+            {"id": i, "home_team_id": rng.randint(1, teams), "away_team_id": rng.randint(1, teams),
+             "date": start_date + timedelta(days=i % 2000), "status": "completed"}
+            for i in range(1, matches + 1)
+        ])
+        connection.execute(insert(MatchEvent), [
+            {"match_id": i // EVENTS_PER_MATCH + 1, "minute": i % 90 + 1, "event_type": "shot",
+             "player_id": rng.randint(1, players), "team_id": rng.randint(1, teams)}
+            for i in range(events)
+        ])
+    return teams, matches
+
+
+def drop_indexes(engine):
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                connection.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+
+
+def time_queries(engine, teams: int, matches: int, players: int, repeat: int) -> dict:
+    rng = random.Random(1)
+    queries = {
+        "players_by_team": lambda: select(Player).where(Player.team_id == rng.randint(1, teams)),
+        "players_by_team_position": lambda: select(Player).where(
+            Player.team_id == rng.randint(1, teams), Player.position == "Defender"),
+        "tactics_by_team": lambda: select(TeamTactics).where(
+            TeamTactics.team_id == rng.randint(1, teams)),
+        "home_matches_by_date": lambda: select(Match).where(
+            Match.home_team_id == rng.randint(1, teams)).order_by(Match.date.desc()),
+        "events_by_match": lambda: select(MatchEvent).where(
+            MatchEvent.match_id == rng.randint(1, matches)),
+        "events_by_player": lambda: select(MatchEvent).where(
+            MatchEvent.player_id == rng.randint(1, players)),
+    }
+
+    timings = {}
+    with engine.connect() as connection:
+        for name, build in queries.items():
+            start = time.perf_counter()
+            for _ in range(repeat):
+                connection.execute(build()).all()
+            timings[name] = (time.perf_counter() - start) / repeat * 1000
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=100000)
+    parser.add_argument("--events", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=20, help="executions per query")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        models.configure_database(f"sqlite:///{os.path.join(directory, 'indexes.db')}")
+        engine = models.init_db()
+        teams, matches = populate(engine, args.players, args.events)
+
+        drop_indexes(engine)
+        without = time_queries(engine, teams, matches, args.players, args.repeat)
+        models.ensure_indexes(engine)
+        with_indexes = time_queries(engine, teams, matches, args.players, args.repeat)
+        models.dispose_engine()
+
+    json.dump({
+        "players": args.players,
+        "events": args.events,
+        "ms_per_query": {
+            name: {"without_indexes": without[name], "with_indexes": with_indexes[name]}
+            for name in without
+        },
+    }, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Regression check: tactics-aware engines with short squads.
+
+Usage: python -m benchmarks.short_squads [--max-players 11] [--seed 0]
+
+Plays every formation with every pair of squad sizes from 1 to
+``--max-players`` through ``MatchEngine``, ``EventDrivenMatchEngine`` and
+the vectorized engine, once with positions listed goalkeeper and defence
+first and once without positions. Fails if a match raises, possession
+leaves 0-100, or a squad without positions (so every player is borrowed)
+is left without a midfield, or without an attack from two players up.
+Prints a JSON summary; exit status 1 on failure.
+"""
+import argparse
+import json
+import math
+import sys
+
+import numpy as np
+
+from logic.event_engine import EventDrivenMatchEngine
+from logic.match_engine import MatchEngine
+from logic.rng import match_rng
+from logic.simulation import make_fixture
+from logic.strength import line_ratings
+from logic.tactics import FORMATIONS, Tactics
+from logic.vectorized_engine import simulate_fixtures_vectorized
+
+# Back line first, so naive gap filling runs out before midfield
+POSITIONS = ["Goalkeeper", "Defender", "Defender", "Defender", "Defender",
+             "Midfielder", "Midfielder", "Midfielder", "Midfielder", "Forward", "Forward"]
+
+
+def make_team(team_id: int, size: int, positions: bool):
+    return {
+        "id": team_id,
+        "name": f"Team {team_id}",
+        "players": [
+            {"id": team_id * 100 + number, "name": f"Player {team_id}-{number}",
+             "position": POSITIONS[number % len(POSITIONS)] if positions else None,
+             "attack": 60, "defense": 60, "stamina": 60, "speed": 60, "technique": 60}
+            for number in range(size)
+        ],
+    }
+
+
+def check(home_size: int, away_size: int, formation: str, positions: bool, seed: int):
+    """Problems found for one pairing, as strings"""
+    problems = []
+    home, away = make_team(1, home_size, positions), make_team(2, away_size, positions)
+    tactics = Tactics(formation)
+    for team in (home, away):
+        size = len(team["players"])
+        ratings = line_ratings(team, tactics)
+        if not all(math.isfinite(value) and value >= 0 for value in ratings):
+            problems.append(f"{size} players rated {tuple(ratings)}")
+        if not positions and ratings.midfield == 0:
+            problems.append(f"{size} borrowed players leave midfield empty")
+        if not positions and size >= 2 and ratings.attack == 0:
+            problems.append(f"{size} borrowed players leave attack empty")
+
+    for engine_class in (MatchEngine, EventDrivenMatchEngine):
+        try:
+            engine = engine_class(home, away, tactics, tactics, rng=match_rng(seed, home_size, away_size))
+            engine.simulate_match()
+        except Exception as e:
+            problems.append(f"{engine_class.__name__} raised {e!r}")
+            continue
+        if not 0 <= engine.possession["home"] <= 100:
+            problems.append(f"{engine_class.__name__} possession {engine.possession['home']}")
+
+    try:
+        with np.errstate(all="raise"):
+            simulate_fixtures_vectorized([make_fixture(home, away, tactics, tactics)])
+    except Exception as e:
+        problems.append(f"vectorized raised {e!r}")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-players", type=int, default=11)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    failures = []
+    cases = 0
+    for formation in FORMATIONS:
+        for positions in (True, False):
+            for home_size in range(1, args.max_players + 1):
+                for away_size in range(1, args.max_players + 1):
+                    cases += 1
+                    for problem in check(home_size, away_size, formation, positions, args.seed):
+                        failures.append({"formation": formation, "positions": positions,
+                                         "home_players": home_size, "away_players": away_size,
+                                         "problem": problem})
+
+    json.dump({"cases": cases, "passed": not failures, "failures": failures[:50]},
+              sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0 if not failures else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
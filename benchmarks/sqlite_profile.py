@@ -0,0 +1,72 @@
+"""Compare SQLite insert/read throughput with and without the tuned profile.
+
+Usage: python -m benchmarks.sqlite_profile [--batches 500] [--batch-size 10]
+
+Each run uses a throw-away database in a temporary directory, so the
+application database is never touched.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from database import models
+from database import create_sample_data, save_match_results, session_scope, Player, Match
+from logic.simulation import load_round_robin, simulate_fixtures
+
+
+def run_profile(path: str, tuned: bool, batches: int, batch_size: int) -> dict:
+    models.configure_database(f"sqlite:///{path}", sqlite_tuning=tuned)
+    models.init_db()
+    create_sample_data()
+
+    with session_scope() as session:
+        fixtures = load_round_robin(session)
+    results = simulate_fixtures((fixtures * batch_size)[:batch_size], seed=0)
+
+    # One transaction per batch, as a matchday writer would do
+    start = time.perf_counter()
+    for _ in range(batches):
+        save_match_results(results)
+    insert_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reads = 0
+    with session_scope() as session:
+        for _ in range(batches):
+            session.query(Player).filter_by(team_id=1).all()
+            session.query(Match).filter_by(home_team_id=1).limit(50).all()
+            reads += 2
+    read_seconds = time.perf_counter() - start
+
+    models.dispose_engine()
+    return {
+        "tuned": tuned,
+        "matches_inserted": batches * batch_size,
+        "insert_seconds": insert_seconds,
+        "matches_per_second": batches * batch_size / insert_seconds,
+        "read_queries": reads,
+        "reads_per_second": reads / read_seconds,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batches", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    report = []
+    with tempfile.TemporaryDirectory() as directory:
+        for tuned in (False, True):
+            path = os.path.join(directory, f"bench_{int(tuned)}.db")
+            report.append(run_profile(path, tuned, args.batches, args.batch_size))
+
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
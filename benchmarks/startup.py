@@ -0,0 +1,62 @@
+"""Measure desktop app startup with the built-in startup profiler.
+
+Usage: python -m benchmarks.startup [--runs 5] [--teams 0]
+
+Each run starts ``main.py`` in a fresh interpreter (so import costs are
+real) on the offscreen Qt platform, against a throw-away database holding
+the sample data plus ``--teams`` synthetic teams. Prints the median first
+paint time and every run's profiler report as JSON.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from database import models
+from database import create_sample_data, generate_league_data
+
+MAIN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+
+
+def run_startup(database_url: str, report_path: str) -> dict:
+    env = dict(os.environ, FOOTBALL_MANAGER_DB_URL=database_url, QT_QPA_PLATFORM="offscreen")
+    subprocess.run(
+        [sys.executable, MAIN, "--profile-startup", report_path, "--quit-after-startup"],
+        env=env, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    with open(report_path) as report_file:
+        return json.load(report_file)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--teams", type=int, default=0, help="synthetic teams to add")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = f"sqlite:///{os.path.join(directory, 'startup.db')}"
+        models.configure_database(database_url)
+        models.init_db()
+        create_sample_data()
+        if args.teams:
+            generate_league_data(args.teams)
+        models.dispose_engine()
+
+        runs = [run_startup(database_url, os.path.join(directory, f"run_{run}.json"))
+                for run in range(args.runs)]
+
+    report = {
+        "teams": args.teams,
+        "median_first_paint_seconds": statistics.median(run["first_paint_seconds"] for run in runs),
+        "runs": runs,
+    }
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,10 @@
-from .models import Base, Player, Team, TeamTactics, init_db, get_session
+from .models import (Base, Player, Team, TeamTactics, Match, MatchEvent, init_db, get_session,
+                     get_engine, session_scope)
 from .sample_data import create_sample_data
+from .synthetic_data import generate_league_data
+from .results import save_match_results
+from .migrations import migrate, SCHEMA_VERSION
 
-__all__ = ['Base', 'Player', 'Team', 'TeamTactics', 'init_db', 'get_session', 'create_sample_data']
+__all__ = ['Base', 'Player', 'Team', 'TeamTactics', 'Match', 'MatchEvent', 'init_db',
+           'get_session', 'get_engine', 'session_scope', 'create_sample_data',
+           'generate_league_data', 'save_match_results', 'migrate', 'SCHEMA_VERSION']
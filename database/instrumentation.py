@@ -0,0 +1,164 @@
+"""SQL instrumentation: statement counts, latency per call site, N+1 detection.
+
+Enable with ``FOOTBALL_MANAGER_SQL_DEBUG=1``; ``get_engine`` then installs
+the hooks on the application engine. Other engines can be instrumented
+with ``install(engine)``.
+
+Every statement is charged to its call site: the first frame of
+application code outside the ``database`` package, so a query issued by
+``keyset_page`` or a lazy load is reported at the view line that caused
+it. When one call site runs the same SELECT ``N_PLUS_ONE_THRESHOLD``
+times within ``N_PLUS_ONE_WINDOW`` seconds (e.g. a lazy load inside a
+loop) it is logged as a likely N+1 pattern. Statements that raise are
+timed and counted as failures of their call site. ``query_stats.snapshot()``
+returns everything collected so far; the desktop app shows it in
+``ui.sql_debug_panel.SqlDebugPanel``.
+"""
+import logging
+import os
+import sys
+import sysconfig
+import threading
+import time
+from collections import deque
+
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+SQL_DEBUG = os.environ.get("FOOTBALL_MANAGER_SQL_DEBUG", "0") != "0"
+
+N_PLUS_ONE_THRESHOLD = 5
+N_PLUS_ONE_WINDOW = 1.0  # seconds
+
+_PACKAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "")
+_PROJECT_DIR = os.path.join(os.path.dirname(os.path.dirname(_PACKAGE_DIR)), "")
+# Installed packages and the interpreter are never application code, even
+# in a virtualenv created inside the project directory
+_LIBRARY_DIRS = tuple(sorted({
+    os.path.join(os.path.abspath(path), "")
+    for path in (sysconfig.get_paths()["purelib"], sysconfig.get_paths()["platlib"],
+                 sys.prefix, sys.base_prefix, sys.exec_prefix)
+}))
+_LIBRARY_PARTS = (f"{os.sep}site-packages{os.sep}", f"{os.sep}dist-packages{os.sep}")
+
+
+def call_site():
+    """``path:line (function)`` of the application code issuing a statement"""
+    fallback = None
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        # Skip "<string>"-style names of generated code
+        if not filename.startswith("<"):
+            filename = os.path.abspath(filename)
+        if (filename.startswith(_PROJECT_DIR) and not filename.startswith(_LIBRARY_DIRS)
+                and not any(part in filename for part in _LIBRARY_PARTS)
+                and filename != __file__):
+            site = (f"{os.path.relpath(filename, _PROJECT_DIR)}:{frame.f_lineno} "
+                    f"({frame.f_code.co_name})")
+            if not filename.startswith(_PACKAGE_DIR):
+                return site
+            fallback = fallback or site
+        frame = frame.f_back
+    return fallback or "<unknown>"
+
+
+class QueryStats:
+    """Thread-safe statement statistics, filled by the engine hooks"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.statements = 0
+            self.seconds = 0.0
+            self.failures = 0
+            self.call_sites = {}
+            self.n_plus_one = {}
+            self._recent = {}
+
+    def record(self, site, statement, elapsed, failed=False):
+        now = time.perf_counter()
+        with self._lock:
+            self.statements += 1
+            self.seconds += elapsed
+            stats = self.call_sites.setdefault(
+                site, {"statements": 0, "seconds": 0.0, "max_seconds": 0.0, "failures": 0}
+            )
+            stats["statements"] += 1
+            stats["seconds"] += elapsed
+            stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+            if failed:
+                self.failures += 1
+                stats["failures"] += 1
+                return
+
+            # Only repeated reads are N+1 candidates, not e.g. schema checks
+            if statement.lstrip()[:6].upper() != "SELECT":
+                return
+            key = (site, statement)
+            recent = self._recent.get(key)
+            if recent is None:
+                recent = self._recent[key] = deque(maxlen=N_PLUS_ONE_THRESHOLD)
+            recent.append(now)
+            repeated = len(recent) == N_PLUS_ONE_THRESHOLD and now - recent[0] <= N_PLUS_ONE_WINDOW
+            if repeated or key in self.n_plus_one:
+                first_time = key not in self.n_plus_one
+                self.n_plus_one[key] = self.n_plus_one.get(key, N_PLUS_ONE_THRESHOLD - 1) + 1
+                if first_time:
+                    logger.warning("Possible N+1 query at %s: %s", site, " ".join(statement.split()))
+
+    def snapshot(self):
+        """Totals, per call site stats (slowest first) and suspected N+1 patterns"""
+        with self._lock:
+            return {
+                "statements": self.statements,
+                "seconds": self.seconds,
+                "failures": self.failures,
+                "call_sites": dict(sorted(
+                    ((site, dict(stats)) for site, stats in self.call_sites.items()),
+                    key=lambda item: -item[1]["seconds"],
+                )),
+                "n_plus_one": [
+                    {"call_site": site, "statement": statement, "statements": count}
+                    for (site, statement), count in self.n_plus_one.items()
+                ],
+            }
+
+
+query_stats = QueryStats()
+
+
+def _before_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("instrumentation_start", []).append(time.perf_counter())
+
+
+def _after_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["instrumentation_start"].pop()
+    site = call_site()
+    query_stats.record(site, statement, elapsed)
+    logger.debug("%.2f ms at %s: %s", elapsed * 1000, site, statement)
+
+
+def _handle_error(context):
+    # A failed statement never reaches after_cursor_execute, so its start
+    # time is popped here; errors raised before a cursor ran have none
+    starts = context.connection.info.get("instrumentation_start") if context.connection else None
+    if not starts or context.statement is None:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    site = call_site()
+    query_stats.record(site, context.statement, elapsed, failed=True)
+    logger.debug("%.2f ms at %s failed (%s): %s", elapsed * 1000, site,
+                 context.original_exception, context.statement)
+
+
+def install(engine):
+    """Collect statistics for every statement run on ``engine``"""
+    if not event.contains(engine, "before_cursor_execute", _before_execute):
+        event.listen(engine, "before_cursor_execute", _before_execute)
+        event.listen(engine, "after_cursor_execute", _after_execute)
+        event.listen(engine, "handle_error", _handle_error)
@@ -0,0 +1,77 @@
+"""Forward-only schema migrations.
+
+The schema version lives in a one-row ``schema_version`` table. Each
+migration runs in its own transaction and bumps the version, so upgrading
+an existing database never rebuilds the file and startup only costs a
+single version lookup once the schema is current. Migrations must be
+idempotent, because databases created before versioning start at 0.
+"""
+from sqlalchemy import Column, Integer, MetaData, Table, inspect, select, text
+
+from .models import Base, ensure_indexes, get_engine
+
+version_metadata = MetaData()
+schema_version = Table(
+    "schema_version",
+    version_metadata,
+    Column("version", Integer, nullable=False),
+)
+
+
+def _create_tables(connection):
+    Base.metadata.create_all(connection, checkfirst=True)
+
+
+def _create_indexes(connection):
+    ensure_indexes(connection)
+
+
+def _drop_redundant_indexes(connection):
+    # Each is the leading column of a composite index on the same table
+    for name in ("ix_players_team_id", "ix_matches_home_team_id",
+                 "ix_matches_away_team_id", "ix_match_events_player_id"):
+        connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+
+# (version, description, upgrade) in application order; append new steps here
+MIGRATIONS = [
+    (1, "initial schema", _create_tables),
+    (2, "indexes on foreign keys and match history", _create_indexes),
+    (3, "sort key indexes for paging through teams", _create_indexes),
+    (4, "drop indexes covered by composite indexes", _drop_redundant_indexes),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(connection) -> int:
+    """Return the stored schema version, 0 for unversioned databases"""
+    if not inspect(connection).has_table(schema_version.name):
+        return 0
+    return connection.execute(select(schema_version.c.version)).scalar() or 0
+
+
+def _set_schema_version(connection, version: int):
+    connection.execute(schema_version.delete())
+    connection.execute(schema_version.insert().values(version=version))
+
+
+def migrate(engine=None) -> int:
+    """Bring the database up to ``SCHEMA_VERSION`` in place"""
+    engine = engine or get_engine()
+
+    with engine.connect() as connection:
+        current = get_schema_version(connection)
+    if current >= SCHEMA_VERSION:
+        return current
+
+    version_metadata.create_all(engine, checkfirst=True)
+    for version, description, upgrade in MIGRATIONS:
+        if version <= current:
+            continue
+        with engine.begin() as connection:
+            upgrade(connection)
+            _set_schema_version(connection, version)
+        current = version
+
+    return current
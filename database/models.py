@@ -1,3 +1,6 @@
+import os
+from contextlib import contextmanager
+
 from sqlalchemy import (
     create_engine,
     Column,
@@ -7,10 +10,17 @@ from sqlalchemy import (
     ForeignKey,
     Date,
     JSON,
+    Index,
+    event,
 )
+from sqlalchemy.engine import Connection, make_url
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.schema import CreateIndex
 from sqlalchemy.orm import relationship, sessionmaker
 
+from . import instrumentation
+from .paging import sort_key
+
 Base = declarative_base()
 
 
@@ -39,6 +49,11 @@ class Player(Base):
     # Relationships
     team = relationship("Team", back_populates="players")
 
+    __table_args__ = (
+        # SquadView filters a team's squad by position
+        Index("ix_players_team_id_position", "team_id", "position"),
+    )
+
 
 class Team(Base):
     __tablename__ = "teams"
@@ -60,11 +75,19 @@ class Team(Base):
     )
 
 
+# TeamView pages through teams by (sort key, id) for every sortable column;
+# these let each page seek straight to its first row instead of sorting
+Index("ix_teams_name_sort", sort_key(Team.name), Team.id)
+Index("ix_teams_country_sort", sort_key(Team.country), Team.id)
+Index("ix_teams_league_sort", sort_key(Team.league), Team.id)
+Index("ix_teams_budget_sort", sort_key(Team.budget), Team.id)
+
+
 class TeamTactics(Base):
     __tablename__ = "team_tactics"
 
     id = Column(Integer, primary_key=True)
-    team_id = Column(Integer, ForeignKey("teams.id"))
+    team_id = Column(Integer, ForeignKey("teams.id"), index=True)
     name = Column(String(100))  # e.g., "Default", "Attacking", "Defensive"
     formation = Column(String(50))  # e.g., "4-4-2", "4-3-3"
     player_positions = Column(JSON)  # Store player positions as JSON
@@ -82,7 +105,7 @@ class Match(Base):
     away_team_id = Column(Integer, ForeignKey("teams.id"))
     home_score = Column(Integer, default=0)
     away_score = Column(Integer, default=0)
-    date = Column(Date)
+    date = Column(Date, index=True)
     status = Column(String(20))  # "scheduled", "in_progress", "completed"
     possession = Column(JSON)  # Store possession stats
     shots = Column(JSON)  # Store shot stats
@@ -96,12 +119,18 @@ class Match(Base):
     )
     events = relationship("MatchEvent", back_populates="match")
 
+    __table_args__ = (
+        # A team's match history, most recent first
+        Index("ix_matches_home_team_id_date", "home_team_id", "date"),
+        Index("ix_matches_away_team_id_date", "away_team_id", "date"),
+    )
+
 
 class MatchEvent(Base):
     __tablename__ = "match_events"
 
     id = Column(Integer, primary_key=True)
-    match_id = Column(Integer, ForeignKey("matches.id"))
+    match_id = Column(Integer, ForeignKey("matches.id"), index=True)
     minute = Column(Integer)
     event_type = Column(String(50))  # "goal", "shot", "foul", "card", etc.
     player_id = Column(Integer, ForeignKey("players.id"))
@@ -113,23 +142,132 @@ class MatchEvent(Base):
     player = relationship("Player")
     team = relationship("Team")
 
+    __table_args__ = (
+        # Per-player stats such as goals scored
+        Index("ix_match_events_player_id_event_type", "player_id", "event_type"),
+    )
+
+
+# Override with e.g. FOOTBALL_MANAGER_DB_URL=sqlite:////srv/fm/league.db
+DATABASE_URL = os.environ.get("FOOTBALL_MANAGER_DB_URL", "sqlite:///football_manager.db")
+
+# Applied to every new SQLite connection: WAL lets the UI read while
+# simulations write, and the cache/mmap settings keep hot pages in memory.
+# Set FOOTBALL_MANAGER_SQLITE_TUNING=0 to fall back to SQLite defaults.
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -64000,  # 64 MB (negative values are KiB)
+    "mmap_size": 268435456,  # 256 MB
+    "temp_store": "MEMORY",
+}
+SQLITE_TUNING = os.environ.get("FOOTBALL_MANAGER_SQLITE_TUNING", "1") != "0"
+
+# One engine (and connection pool) per process; sessions are cheap to create
+_engine = None
+Session = sessionmaker()
+
 
-def init_db():
-    """Initialize the database and create tables"""
-    import os
+def configure_database(url: str = None, sqlite_tuning: bool = None):
+    """Point the application at another database and/or toggle SQLite tuning"""
+    global DATABASE_URL, SQLITE_TUNING
+    dispose_engine()
+    if url is not None:
+        DATABASE_URL = url
+    if sqlite_tuning is not None:
+        SQLITE_TUNING = sqlite_tuning
 
-    # Remove existing database file if it exists
-    db_file = "football_manager.db"
-    if os.path.exists(db_file):
-        os.remove(db_file)
 
-    engine = create_engine("sqlite:///football_manager.db")
-    Base.metadata.create_all(engine)
+def database_path():
+    """Filesystem path of the SQLite database, or None for other backends"""
+    url = make_url(DATABASE_URL)
+    if url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:"):
+        return None
+    return url.database
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {pragma}={value}")
+    cursor.close()
+
+
+def get_engine():
+    """Return the process-wide engine, creating it on first use"""
+    global _engine
+    if _engine is None:
+        pool_options = {"pool_size": 5, "max_overflow": 10}
+        if make_url(DATABASE_URL).get_backend_name() == "sqlite" and database_path() is None:
+            # In-memory SQLite uses a SingletonThreadPool, which has no sizing
+            pool_options = {}
+        _engine = create_engine(DATABASE_URL, **pool_options)
+        if SQLITE_TUNING and _engine.dialect.name == "sqlite":
+            event.listen(_engine, "connect", _apply_sqlite_pragmas)
+        if instrumentation.SQL_DEBUG:
+            instrumentation.install(_engine)
+        Session.configure(bind=_engine)
+    return _engine
+
+
+def dispose_engine():
+    """Close all pooled connections, e.g. before the database file is replaced"""
+    global _engine
+    if _engine is not None:
+        _engine.dispose()
+        _engine = None
+
+
+def init_db(reset: bool = False):
+    """Create the database or upgrade its schema in place.
+
+    Existing data is kept; pass ``reset=True`` to delete the database file
+    and start from an empty schema.
+    """
+    from .migrations import migrate
+
+    if reset:
+        # Remove existing database file (and WAL side files) if it exists
+        dispose_engine()
+        db_file = database_path()
+        if db_file:
+            for path in (db_file, db_file + "-wal", db_file + "-shm"):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    engine = get_engine()
+    migrate(engine)
     return engine
 
 
+def ensure_indexes(engine=None):
+    """Create any indexes missing from an existing database file"""
+    engine = engine or get_engine()
+    if not isinstance(engine, Connection):
+        with engine.begin() as connection:
+            return ensure_indexes(connection)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            # IF NOT EXISTS rather than checkfirst: reflection cannot see
+            # expression indexes such as the teams sort keys
+            engine.execute(CreateIndex(index, if_not_exists=True))
+
+
 def get_session():
-    """Create a new database session"""
-    engine = create_engine("sqlite:///football_manager.db")
-    Session = sessionmaker(bind=engine)
+    """Create a new database session from the shared engine"""
+    get_engine()
     return Session()
+
+
+@contextmanager
+def session_scope():
+    """Provide a transactional scope: commit on success, roll back on error"""
+    session = get_session()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
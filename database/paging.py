@@ -0,0 +1,62 @@
+from typing import List, Optional, Sequence, Tuple
+
+from sqlalchemy import func, literal_column, select
+
+# Rows fetched per page by the lazily loading Qt models
+PAGE_SIZE = 200
+
+
+def keyset_page(session, columns: Sequence, id_column, sort_column=None,
+                after: Optional[Tuple] = None, descending: bool = False,
+                limit: int = PAGE_SIZE) -> List:
+    """Fetch one page of rows ordered by ``(sort_column, id_column)``.
+
+    ``after`` is the ``(sort value, id)`` key of the last row already seen
+    (just ``(id,)`` without a sort column). Seeking past it instead of using
+    OFFSET keeps every page as cheap as the first, however deep the scroll.
+    The sort value is the last item of each returned row.
+    """
+    if sort_column is not None:
+        key = (sort_key(sort_column), id_column)
+        query = select(*columns, key[0])
+    else:
+        key = (id_column,)
+        query = select(*columns, id_column)
+
+    if after is not None:
+        query = query.where(_seek(key, after, descending))
+
+    query = query.order_by(*(part.desc() if descending else part for part in key)).limit(limit)
+    return session.execute(query).all()
+
+
+def _seek(key, after, descending):
+    """Rows strictly after ``after`` in ``key`` order.
+
+    ``(sort, id) > (value, last_id)`` is spelled out as ``sort >= value AND
+    (sort > value OR id > last_id)`` because SQLite only turns the leading
+    ``>=`` into an index range seek, not a row-value comparison.
+    """
+    if len(key) == 1:
+        return key[0] < after[0] if descending else key[0] > after[0]
+    (sort, id_column), (value, last_id) = key, after
+    if descending:
+        return (sort <= value) & ((sort < value) | (id_column < last_id))
+    return (sort >= value) & ((sort > value) | (id_column > last_id))
+
+
+def sort_key(column):
+    """``coalesce(column, '')`` (or 0): the expression pages are sorted on.
+
+    NULLs would break the row-value comparison, so they sort as ''/0. The
+    default is inlined rather than bound so SQLite can match the expression
+    indexes built from this same function (see ``database.models``).
+    """
+    return func.coalesce(column, literal_column("''" if _is_text(column) else "0"))
+
+
+def _is_text(column) -> bool:
+    try:
+        return column.type.python_type is str
+    except NotImplementedError:
+        return False
@@ -0,0 +1,69 @@
+from datetime import date
+from typing import Dict, List
+
+from sqlalchemy import insert
+
+from .models import Match, MatchEvent, session_scope
+
+
+def save_match_results(results: List[Dict], match_date: date = None, session=None) -> List[int]:
+    """Persist simulated matches and their events in a single transaction.
+
+    ``results`` use the format produced by ``logic.simulation``. Matches are
+    written with one multi-row INSERT ... RETURNING and events with one
+    executemany, so a whole matchday costs a couple of round trips instead of
+    a flush per ORM object. Returns the new match ids in input order.
+    """
+    if not results:
+        return []
+
+    match_date = match_date or date.today()
+    match_rows = [
+        {
+            "home_team_id": result["home_team_id"],
+            "away_team_id": result["away_team_id"],
+            "home_score": result["home_score"],
+            "away_score": result["away_score"],
+            "date": match_date,
+            "status": "completed",
+            "possession": result["stats"]["possession"],
+            "shots": result["stats"]["shots"],
+        }
+        for result in results
+    ]
+
+    if session is None:
+        with session_scope() as session:
+            return _insert_results(session, match_rows, results)
+
+    try:
+        match_ids = _insert_results(session, match_rows, results)
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    return match_ids
+
+
+def _insert_results(session, match_rows: List[Dict], results: List[Dict]) -> List[int]:
+    match_ids = session.scalars(
+        insert(Match).returning(Match.id, sort_by_parameter_order=True),
+        match_rows,
+    ).all()
+
+    event_rows = [
+        {
+            "match_id": match_id,
+            "minute": event["minute"],
+            "event_type": event["event_type"],
+            "player_id": event["player_id"],
+            "team_id": event["team_id"],
+            "details": event["details"],
+        }
+        for match_id, result in zip(match_ids, results)
+        for event in result["events"]
+    ]
+    if event_rows:
+        session.execute(insert(MatchEvent), event_rows)
+
+    return list(match_ids)
@@ -335,8 +335,8 @@ def create_sample_data():
 
 
 if __name__ == "__main__":
-    # Initialize database
-    init_db()
+    # Initialize an empty database
+    init_db(reset=True)
     # Create sample data
     create_sample_data()
     print("Sample data created successfully!")
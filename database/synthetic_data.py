@@ -0,0 +1,167 @@
+"""Scalable synthetic league data for load testing.
+
+Unlike ``create_sample_data``, which hand-codes a few teams through the ORM,
+this generator produces any number of teams, players and default tactics
+with Core bulk inserts, committing one chunk of teams per transaction.
+Output is fully determined by the seed and size parameters.
+
+Usage: python -m database.synthetic_data --teams 4000 --players-per-team 25 --seed 1
+"""
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import func, insert, select
+
+from .models import Player, Team, TeamTactics, get_engine, init_db
+
+FIRST_NAMES = [
+    "Adam", "Bruno", "Carlos", "David", "Emil", "Felix", "Gabriel", "Hugo", "Ivan",
+    "Jonas", "Kai", "Luca", "Mateo", "Nico", "Oscar", "Pablo", "Rafael", "Sami",
+    "Tomas", "Victor", "Yusuf", "Zoran",
+]
+LAST_NAMES = [
+    "Almeida", "Berg", "Costa", "Dubois", "Eriksen", "Fischer", "Garcia", "Hansen",
+    "Ivanov", "Jensen", "Kovac", "Lopez", "Martin", "Novak", "Okafor", "Petrov",
+    "Rossi", "Silva", "Tanaka", "Urban", "Weber", "Yilmaz",
+]
+COUNTRIES = {
+    "England": "Premier League",
+    "Spain": "La Liga",
+    "Germany": "Bundesliga",
+    "Italy": "Serie A",
+    "France": "Ligue 1",
+    "Netherlands": "Eredivisie",
+    "Portugal": "Primeira Liga",
+}
+CITIES = ["North", "South", "East", "West", "Central", "Port", "Lake", "Hill", "River", "Bay"]
+SUFFIXES = ["United", "City", "Athletic", "Rovers", "FC", "Wanderers", "Sporting"]
+
+# Share of a squad per position, and each position's attribute bias
+POSITION_SHARES = [("Goalkeeper", 0.1), ("Defender", 0.35), ("Midfielder", 0.35), ("Forward", 0.2)]
+POSITION_BIAS = {
+    "Goalkeeper": {"attack": -40, "defense": 15, "speed": -10},
+    "Defender": {"attack": -15, "defense": 15},
+    "Midfielder": {"technique": 10},
+    "Forward": {"attack": 15, "defense": -25, "speed": 5},
+}
+DEFAULT_ROLES = {
+    "Goalkeeper": "Goalkeeper",
+    "Defender": "Centre-Back",
+    "Midfielder": "Central Midfielder",
+    "Forward": "Advanced Forward",
+}
+# Starters per position in the generated default 4-4-2
+FORMATION_SLOTS = {"Goalkeeper": 1, "Defender": 4, "Midfielder": 4, "Forward": 2}
+
+
+def _squad_positions(size: int):
+    """Positions of a squad of ``size`` players, following ``POSITION_SHARES``"""
+    positions = []
+    for position, share in POSITION_SHARES:
+        positions += [position] * max(1, round(size * share))
+    positions += ["Midfielder"] * (size - len(positions))
+    return positions[:size]
+
+
+def _player_row(rng: random.Random, player_id: int, team_id: int, position: str, today: date):
+    base = rng.randint(45, 85)
+    bias = POSITION_BIAS[position]
+    stats = {
+        stat: max(1, min(99, base + bias.get(stat, 0) + rng.randint(-10, 10)))
+        for stat in ("attack", "defense", "stamina", "speed", "technique")
+    }
+    quality = sum(stats.values()) / 5
+    return {
+        "id": player_id,
+        "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+        "age": rng.randint(17, 36),
+        "position": position,
+        "nationality": rng.choice(list(COUNTRIES)),
+        "team_id": team_id,
+        "wage": round(quality ** 2 * 20, -2),
+        "value": round(quality ** 3 * 100, -3),
+        "contract_end": today + timedelta(days=365 * rng.randint(1, 5)),
+        **stats,
+    }
+
+
+def generate_league_data(teams: int = 100, players_per_team: int = 25, seed: int = 0,
+                         chunk_size: int = 500, engine=None) -> dict:
+    """Append ``teams`` synthetic teams with squads and default tactics.
+
+    Rows are inserted with executemany in transactions of ``chunk_size``
+    teams. Returns the number of rows written per table.
+    """
+    engine = engine or get_engine()
+    rng = random.Random(seed)
+    today = date.today()
+    positions = _squad_positions(players_per_team)
+
+    with engine.connect() as connection:
+        next_team_id = (connection.execute(select(func.max(Team.id))).scalar() or 0) + 1
+        next_player_id = (connection.execute(select(func.max(Player.id))).scalar() or 0) + 1
+
+    written = {"teams": 0, "players": 0, "team_tactics": 0}
+    for chunk_start in range(0, teams, chunk_size):
+        team_rows, player_rows, tactics_rows = [], [], []
+
+        for team_id in range(next_team_id, next_team_id + min(chunk_size, teams - chunk_start)):
+            country = rng.choice(list(COUNTRIES))
+            team_rows.append({
+                "id": team_id,
+                "name": f"{rng.choice(CITIES)} {rng.choice(SUFFIXES)} {team_id}",
+                "country": country,
+                "league": COUNTRIES[country],
+                "budget": float(rng.randint(5, 300) * 1000000),
+            })
+
+            roles = {}
+            slots = dict(FORMATION_SLOTS)
+            for position in positions:
+                player_rows.append(_player_row(rng, next_player_id, team_id, position, today))
+                if slots[position]:
+                    slots[position] -= 1
+                    roles[str(next_player_id)] = DEFAULT_ROLES[position]
+                next_player_id += 1
+
+            tactics_rows.append({
+                "team_id": team_id,
+                "name": "Default 4-4-2",
+                "formation": "4-4-2",
+                "player_positions": {},
+                "player_roles": roles,
+            })
+
+        with engine.begin() as connection:
+            connection.execute(insert(Team), team_rows)
+            connection.execute(insert(Player), player_rows)
+            connection.execute(insert(TeamTactics), tactics_rows)
+
+        next_team_id += len(team_rows)
+        written["teams"] += len(team_rows)
+        written["players"] += len(player_rows)
+        written["team_tactics"] += len(tactics_rows)
+
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a large synthetic league")
+    parser.add_argument("--teams", type=int, default=1000)
+    parser.add_argument("--players-per-team", type=int, default=25)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=500, help="teams per transaction")
+    parser.add_argument("--reset", action="store_true", help="wipe the database first")
+    args = parser.parse_args(argv)
+
+    engine = init_db(reset=args.reset)
+    start = time.perf_counter()
+    written = generate_league_data(args.teams, args.players_per_team, args.seed,
+                                   args.chunk_size, engine)
+    print(f"Generated {written} in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Event-driven match engine that skips quiet minutes.
+
+``MatchEngine`` rolls ``EVENT_PROBABILITY`` every minute, so roughly nine
+minutes in ten cost a loop iteration and a random draw for nothing. The
+minutes with an event form a Bernoulli process, so the gap to the next one
+is geometric: ``EventDrivenMatchEngine`` draws that gap directly and jumps
+there, playing each event exactly as ``MatchEngine`` does. Scores, shots
+and event minutes follow the same distribution with well under half the
+random draws; ``benchmarks.event_engine`` checks this statistically.
+
+Seeded matches differ from ``MatchEngine`` ones, since the draws are
+consumed differently. ``simulate_minute`` still advances a single minute,
+so the engine also drives ``MatchView``.
+"""
+import math
+from typing import Optional
+
+from logic import match_engine
+from logic.events import PlayerEvent
+from logic.match_engine import MATCH_MINUTES, MatchEngine
+
+
+class EventDrivenMatchEngine(MatchEngine):
+    def __init__(self, home_team, away_team, home_tactics, away_tactics, rng=None):
+        super().__init__(home_team, away_team, home_tactics, away_tactics, rng)
+        # EVENT_PROBABILITY is read when the engine is created, so
+        # benchmarks can patch it as for MatchEngine
+        probability = match_engine.EVENT_PROBABILITY
+        self._log_quiet = math.log1p(-probability) if 0 < probability < 1 else None
+        self._never = probability <= 0
+        self.next_event_minute = self._event_after(0)
+
+    def _event_after(self, minute: int) -> int:
+        """Minute of the first event after ``minute`` (past full time if none)"""
+        if self._never:
+            return MATCH_MINUTES + 1
+        if self._log_quiet is None:
+            return minute + 1
+        # Inverse transform of a geometric distribution with P(gap > k) = (1 - p)^k
+        return minute + 1 + int(math.log(1.0 - self.rng.random()) / self._log_quiet)
+
+    def _play_minute(self) -> Optional[PlayerEvent]:
+        """Advance one minute and return its typed event, if any"""
+        self.current_minute += 1
+        ratings = self._match_ratings()
+        self.possession["home"] = ratings[0]
+        self.possession["away"] = 100 - self.possession["home"]
+        if self.current_minute != self.next_event_minute:
+            return None
+        self.next_event_minute = self._event_after(self.current_minute)
+        return self._attack(ratings)
+
+    def _advance(self) -> Optional[PlayerEvent]:
+        """Jump to the next event (or full time) and return it"""
+        ratings = self._match_ratings()
+        self.possession["home"] = ratings[0]
+        self.possession["away"] = 100 - self.possession["home"]
+        if self.next_event_minute > MATCH_MINUTES:
+            self.current_minute = MATCH_MINUTES
+            return None
+        self.current_minute = self.next_event_minute
+        self.next_event_minute = self._event_after(self.current_minute)
+        return self._attack(ratings)
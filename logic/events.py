@@ -0,0 +1,76 @@
+"""Typed events yielded by ``MatchEngine.stream``.
+
+``PlayerEvent.to_dict`` gives the plain dict shape stored in
+``MatchEngine.events``, shown by ``MatchView`` and written by
+``database.results``.
+"""
+from dataclasses import dataclass
+from typing import ClassVar, Dict
+
+
+@dataclass(frozen=True)
+class PlayerEvent:
+    """Something a player did in a given minute"""
+    event_type: ClassVar[str]
+
+    minute: int
+    player_id: int
+    team_id: int
+    player_name: str
+    team_name: str
+
+    def details(self) -> Dict:
+        return {}
+
+    def to_dict(self) -> Dict:
+        return {
+            "minute": self.minute,
+            "event_type": self.event_type,
+            "player_id": self.player_id,
+            "team_id": self.team_id,
+            "player_name": self.player_name,
+            "team_name": self.team_name,
+            "details": self.details(),
+        }
+
+
+@dataclass(frozen=True)
+class ShotEvent(PlayerEvent):
+    event_type: ClassVar[str] = "shot"
+
+    outcome: str  # "saved" or "missed"
+
+    def details(self) -> Dict:
+        return {"outcome": self.outcome}
+
+
+@dataclass(frozen=True)
+class GoalEvent(PlayerEvent):
+    event_type: ClassVar[str] = "goal"
+
+    home_score: int
+    away_score: int
+
+    def details(self) -> Dict:
+        return {"score": f"{self.home_score}-{self.away_score}"}
+
+
+@dataclass(frozen=True)
+class FullTimeEvent:
+    """Final whistle, always the last event of a stream"""
+    event_type: ClassVar[str] = "full_time"
+
+    minute: int
+    home_score: int
+    away_score: int
+    possession: Dict[str, float]
+    shots: Dict[str, int]
+
+    def to_dict(self) -> Dict:
+        return {
+            "minute": self.minute,
+            "event_type": self.event_type,
+            "home_score": self.home_score,
+            "away_score": self.away_score,
+            "stats": {"possession": self.possession, "shots": self.shots},
+        }
@@ -1,9 +1,22 @@
+import asyncio
 import random
 from datetime import datetime
-from typing import List, Dict, Tuple
+from typing import AsyncIterator, Iterator, List, Dict, Optional, Tuple
+
+from logic.events import FullTimeEvent, GoalEvent, PlayerEvent, ShotEvent
+from logic.squad import Squad
+from logic.ratings_cache import ratings_cache
+from logic.strength import LineRatings
+
+MATCH_MINUTES = 90
+EVENT_PROBABILITY = 0.1  # Chance of an attacking event in any given minute
 
 class MatchEngine:
-    def __init__(self, home_team, away_team, home_tactics, away_tactics):
+    def __init__(self, home_team, away_team, home_tactics, away_tactics, rng=None):
+        # Private stream so batch and parallel runs neither share nor disturb
+        # the global ``random`` state; pass a seeded ``random.Random`` (see
+        # ``logic.rng.match_rng``) for reproducible matches
+        self.rng = rng if rng is not None else random.Random()
         self.home_team = home_team
         self.away_team = away_team
         self.home_tactics = home_tactics
@@ -14,100 +27,198 @@ class MatchEngine:
         self.current_minute = 0
         self.possession = {"home": 50, "away": 50}
         self.shots = {"home": 0, "away": 0}
+        # Line ratings only change on substitutions, tactic changes or
+        # fatigue updates, so they are cached per side until invalidated
+        self._ratings_cache = {}
         
-    def calculate_team_strength(self, team, tactics) -> float:
-        """Calculate overall team strength based on players and tactics"""
-        total_strength = 0
-        players = team['players']
-        
-        for player in players:
-            # Basic strength calculation
-            player_strength = (
-                player['attack'] + 
-                player['defense'] + 
-                player['stamina'] + 
-                player['speed'] + 
-                player['technique']
-            ) / 5
-            total_strength += player_strength
-            
-        # Average team strength
-        return total_strength / len(players) if players else 0
-    
+    def get_line_ratings(self, side: str) -> LineRatings:
+        """Return the cached attack/midfield/defence ratings of a side under its tactics"""
+        ratings = self._ratings_cache.get(side)
+        if ratings is None:
+            if side == "home":
+                ratings = ratings_cache.ratings(self.home_team, self.home_tactics)
+            else:
+                ratings = ratings_cache.ratings(self.away_team, self.away_tactics)
+            self._ratings_cache[side] = ratings
+        return ratings
+
+    def _match_ratings(self) -> Tuple[float, float, float, float, float]:
+        """Per-minute lookup: home possession, then attack and defence of each side"""
+        table = self._ratings_cache.get("match")
+        if table is None:
+            # Midfield wins possession, attack against defence decides shots
+            home = self.get_line_ratings("home")
+            away = self.get_line_ratings("away")
+            midfield = home.midfield + away.midfield
+            table = self._ratings_cache["match"] = (
+                # Even possession if neither side fields a midfield
+                (home.midfield / midfield) * 100 if midfield else 50,
+                home.attack, home.defense, away.attack, away.defense,
+            )
+        return table
+
+    def invalidate_ratings(self, side: str = None):
+        """Drop cached ratings for one side (or both), e.g. after fatigue updates"""
+        if side is None:
+            self._ratings_cache.clear()
+        else:
+            self._ratings_cache.pop(side, None)
+            self._ratings_cache.pop("match", None)
+
+    def set_tactics(self, side: str, tactics):
+        """Change a side's tactics mid-match"""
+        if side == "home":
+            self.home_tactics = tactics
+        else:
+            self.away_tactics = tactics
+        self.invalidate_ratings(side)
+
+    def substitute(self, side: str, player_out_id: int, player_in: Dict):
+        """Replace a player on the pitch with a substitute"""
+        team = self.home_team if side == "home" else self.away_team
+        if isinstance(team, Squad):
+            # Squads are immutable, so swap in an updated copy
+            team = team.replace_player(player_out_id, player_in)
+        else:
+            # Team dicts are shared between fixtures, so never edit one in place
+            players = list(team['players'])
+            for index, player in enumerate(players):
+                if player['id'] == player_out_id:
+                    players[index] = player_in
+                    break
+            else:
+                raise ValueError(f"Player {player_out_id} is not playing for {team['name']}")
+            team = {**team, 'players': players}
+        if side == "home":
+            self.home_team = team
+        else:
+            self.away_team = team
+        self.invalidate_ratings(side)
+
     def simulate_minute(self) -> Dict:
         """Simulate one minute of the match"""
+        event = self._play_minute()
+        if event is None:
+            return None
+        event = event.to_dict()
+        self.events.append(event)
+        return event
+
+    def _play_minute(self) -> Optional[PlayerEvent]:
+        """Advance one minute and return its typed event, if any"""
         self.current_minute += 1
         
-        # Calculate team strengths
-        home_strength = self.calculate_team_strength(self.home_team, self.home_tactics)
-        away_strength = self.calculate_team_strength(self.away_team, self.away_tactics)
+        # Team ratings (all equal to the squad average without tactics)
+        ratings = self._match_ratings()
         
         # Determine possession
-        total_strength = home_strength + away_strength
-        self.possession["home"] = (home_strength / total_strength) * 100
+        self.possession["home"] = ratings[0]
         self.possession["away"] = 100 - self.possession["home"]
         
         # Chance of event occurring
-        if random.random() < 0.1:  # 10% chance of event per minute
-            if random.random() < self.possession["home"] / 100:
-                attacking_team = self.home_team
-                defending_team = self.away_team
-                is_home = True
-            else:
-                attacking_team = self.away_team
-                defending_team = self.home_team
-                is_home = False
-                
-            # Simulate shot
-            self.shots["home" if is_home else "away"] += 1
-            shot_quality = random.random() * (home_strength if is_home else away_strength)
-            defense_quality = random.random() * (away_strength if is_home else home_strength)
+        if self.rng.random() < EVENT_PROBABILITY:
+            return self._attack(ratings)
+        return None
+
+    # Plays up to the next minute that may hold an event; the event-driven
+    # engine overrides this to skip quiet minutes
+    _advance = _play_minute
+
+    def _attack(self, ratings) -> PlayerEvent:
+        """Play out an attacking move in the current minute"""
+        _, home_attack, home_defense, away_attack, away_defense = ratings
+        if self.rng.random() < self.possession["home"] / 100:
+            attacking_team = self.home_team
+            defending_team = self.away_team
+            is_home = True
+        else:
+            attacking_team = self.away_team
+            defending_team = self.home_team
+            is_home = False
             
-            if shot_quality > defense_quality:
-                # Goal scored!
-                if is_home:
-                    self.home_score += 1
-                else:
-                    self.away_score += 1
-                    
-                # Select random scorer from attacking team
-                scorer = random.choice(attacking_team['players'])
-                
-                event = {
-                    "minute": self.current_minute,
-                    "event_type": "goal",
-                    "player_id": scorer['id'],
-                    "team_id": attacking_team['id'],
-                    "player_name": scorer['name'],
-                    "team_name": attacking_team['name'],
-                    "details": {
-                        "score": f"{self.home_score}-{self.away_score}"
-                    }
-                }
+        # Simulate shot
+        self.shots["home" if is_home else "away"] += 1
+        shot_quality = self.rng.random() * (home_attack if is_home else away_attack)
+        defense_quality = self.rng.random() * (away_defense if is_home else home_defense)
+        
+        if shot_quality > defense_quality:
+            # Goal scored!
+            if is_home:
+                self.home_score += 1
             else:
-                # Shot saved/missed
-                shooter = random.choice(attacking_team['players'])
-                event = {
-                    "minute": self.current_minute,
-                    "event_type": "shot",
-                    "player_id": shooter['id'],
-                    "team_id": attacking_team['id'],
-                    "player_name": shooter['name'],
-                    "team_name": attacking_team['name'],
-                    "details": {
-                        "outcome": "saved" if shot_quality > defense_quality * 0.5 else "missed"
-                    }
-                }
-            
-            self.events.append(event)
-            return event
+                self.away_score += 1
+                
+            # Select random scorer from attacking team
+            scorer_id, scorer_name = self._pick_player(attacking_team)
             
-        return None
+            return GoalEvent(
+                minute=self.current_minute,
+                player_id=scorer_id,
+                team_id=attacking_team['id'],
+                player_name=scorer_name,
+                team_name=attacking_team['name'],
+                home_score=self.home_score,
+                away_score=self.away_score,
+            )
+        else:
+            # Shot saved/missed
+            shooter_id, shooter_name = self._pick_player(attacking_team)
+            return ShotEvent(
+                minute=self.current_minute,
+                player_id=shooter_id,
+                team_id=attacking_team['id'],
+                player_name=shooter_name,
+                team_name=attacking_team['name'],
+                outcome="saved" if shot_quality > defense_quality * 0.5 else "missed",
+            )
+
+    def _pick_player(self, team) -> Tuple[int, str]:
+        """``(id, name)`` of a random player of a team dict or ``Squad``"""
+        if isinstance(team, Squad):
+            return self.rng.choice(team.members)
+        player = self.rng.choice(team['players'])
+        return player['id'], player['name']
+
+    def stream(self, keep_events: bool = False) -> Iterator:
+        """Play the rest of the match lazily, yielding typed events.
+
+        Quiet minutes yield nothing; the last event is a ``FullTimeEvent``.
+        Events are only kept in ``self.events`` with ``keep_events``, so
+        long batch runs stay in bounded memory.
+        """
+        while self.current_minute < MATCH_MINUTES:
+            event = self._advance()
+            if event is not None:
+                if keep_events:
+                    self.events.append(event.to_dict())
+                yield event
+        yield FullTimeEvent(
+            minute=self.current_minute,
+            home_score=self.home_score,
+            away_score=self.away_score,
+            possession=dict(self.possession),
+            shots=dict(self.shots),
+        )
+
+    async def astream(self, keep_events: bool = False,
+                      minute_delay: float = 0.0) -> AsyncIterator:
+        """Async variant of ``stream``.
+
+        Waits ``minute_delay`` seconds per match minute before each event
+        (0 still hands control back to the event loop between events).
+        """
+        minute = self.current_minute
+        for event in self.stream(keep_events):
+            await asyncio.sleep(minute_delay * (event.minute - minute))
+            minute = event.minute
+            yield event
     
     def simulate_match(self) -> Tuple[int, int, List[Dict]]:
         """Simulate entire 90 minute match"""
-        while self.current_minute < 90:
-            self.simulate_minute()
+        while self.current_minute < MATCH_MINUTES:
+            event = self._advance()
+            if event is not None:
+                self.events.append(event.to_dict())
             
         return (
             self.home_score,
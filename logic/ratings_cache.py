@@ -0,0 +1,127 @@
+"""LRU cache of tactic-derived line ratings.
+
+A Monte Carlo season plays every team hundreds of times with the same
+squad and tactics, so ``RatingsCache`` keeps each ``line_ratings`` result
+keyed by ``(team id, version, tactics)``. Every team has a version counter
+that ``invalidate`` bumps whenever its tactics or roster change (the
+TacticsView and SquadView editors call it after each commit), combined
+with a global epoch that ``invalidate()`` bumps for all teams at once, and
+``load_squads`` stamps the current version on the squads it loads. Squads
+loaded before an edit therefore never see ratings computed after it, and
+vice versa.
+
+Only versioned squads are cached. Team dicts and squads built in memory
+(e.g. after a substitution) have no version and are always rated afresh.
+``ratings_cache.stats()`` reports hit rate, size and approximate memory.
+"""
+import os
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from logic.strength import LineRatings, line_ratings
+from logic.tactics import Tactics
+
+MAX_ENTRIES = int(os.environ.get("FOOTBALL_MANAGER_RATINGS_CACHE_SIZE", "4096"))
+
+
+class RatingsCache:
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._versions = {}
+        self._epoch = 0
+        self._bytes = 0
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Zero the counters, keeping the cached ratings"""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.uncached = 0
+            self.evictions = 0
+            self.invalidations = 0
+
+    def version(self, team_id: int) -> Tuple[int, int]:
+        """Current ``(epoch, team version)`` of a team's tactics and roster"""
+        with self._lock:
+            return self._epoch, self._versions.get(team_id, 0)
+
+    def invalidate(self, team_id: Optional[int] = None):
+        """Bump a team's version (all teams if None) and drop its ratings"""
+        with self._lock:
+            self.invalidations += 1
+            if team_id is None:
+                # Covers teams that were never invalidated on their own too
+                self._epoch += 1
+                stale = list(self._entries)
+            else:
+                self._versions[team_id] = self._versions.get(team_id, 0) + 1
+                stale = [key for key in self._entries if key[0] == team_id]
+            for key in stale:
+                self._drop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def ratings(self, team, tactics) -> LineRatings:
+        """``line_ratings(team, tactics)``, from the cache where possible"""
+        version = getattr(team, "version", None)
+        if version is None:
+            with self._lock:
+                self.uncached += 1
+            return line_ratings(team, tactics)
+        if tactics is not None and not isinstance(tactics, Tactics):
+            tactics = Tactics.from_dict(tactics)
+
+        key = (team.id, version, tactics)
+        with self._lock:
+            ratings = self._entries.get(key)
+            if ratings is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return ratings
+            self.misses += 1
+
+        ratings = line_ratings(team, tactics)
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = ratings
+                self._bytes += self._entry_size(key, ratings)
+                while len(self._entries) > self.max_entries:
+                    self._drop(next(iter(self._entries)))
+                    self.evictions += 1
+        return ratings
+
+    def stats(self) -> Dict:
+        """Counters, hit rate and approximate memory held by the cache"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "uncached": self.uncached,
+                "hit_rate": self.hits / lookups if lookups else None,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "bytes": self._bytes + sys.getsizeof(self._entries),
+            }
+
+    def _drop(self, key):
+        self._bytes -= self._entry_size(key, self._entries.pop(key))
+
+    @staticmethod
+    def _entry_size(key, ratings) -> int:
+        # Tactics are shared with the fixtures, so only the key tuple and
+        # the ratings themselves are charged to the cache
+        return sys.getsizeof(key) + sys.getsizeof(ratings) + sum(map(sys.getsizeof, ratings))
+
+
+ratings_cache = RatingsCache()
@@ -0,0 +1,215 @@
+"""Multi-core season and Monte Carlo simulation.
+
+Repetitions of a full double round-robin are split into chunks and fanned
+out over a ``ProcessPoolExecutor``. Every match is seeded from
+``(seed, season, fixture)`` so results are identical regardless of the
+number of workers or the chunk size. Workers send back compact aggregates
+(finishing-position counts and summed table rows) rather than per-match
+results, which keeps inter-process traffic independent of the event count.
+
+Run ``python -m logic.season --help`` for the command line entry point.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from logic.match_engine import MatchEngine
+from logic.ratings_cache import ratings_cache
+from logic.rng import match_rng
+
+TABLE_FIELDS = ("played", "won", "drawn", "lost", "goals_for", "goals_against", "points")
+
+# Team and tactics dicts shipped once to each worker by the pool initializer
+_worker_teams = None
+_worker_tactics = None
+
+
+def double_round_robin(team_ids: List[int]) -> List[Tuple[int, int]]:
+    """Every team plays every other team once at home and once away"""
+    return [(home, away) for home in team_ids for away in team_ids if home != away]
+
+
+def empty_table(team_ids: List[int]) -> Dict[int, Dict]:
+    return {team_id: dict.fromkeys(TABLE_FIELDS, 0) for team_id in team_ids}
+
+
+def record_result(table: Dict[int, Dict], home_id: int, away_id: int,
+                  home_score: int, away_score: int):
+    """Add one match result to a league table"""
+    home = table[home_id]
+    away = table[away_id]
+    home["played"] += 1
+    away["played"] += 1
+    home["goals_for"] += home_score
+    home["goals_against"] += away_score
+    away["goals_for"] += away_score
+    away["goals_against"] += home_score
+
+    if home_score > away_score:
+        home["won"] += 1
+        away["lost"] += 1
+        home["points"] += 3
+    elif home_score < away_score:
+        away["won"] += 1
+        home["lost"] += 1
+        away["points"] += 3
+    else:
+        home["drawn"] += 1
+        away["drawn"] += 1
+        home["points"] += 1
+        away["points"] += 1
+
+
+def standings(table: Dict[int, Dict]) -> List[int]:
+    """Team ids ordered by points, goal difference, goals scored, then id"""
+    return sorted(
+        table,
+        key=lambda team_id: (
+            -table[team_id]["points"],
+            -(table[team_id]["goals_for"] - table[team_id]["goals_against"]),
+            -table[team_id]["goals_for"],
+            team_id,
+        ),
+    )
+
+
+def simulate_season(teams: Dict[int, Dict], tactics: Dict[int, Dict],
+                    seed: int = 0, season: int = 0) -> Dict[int, Dict]:
+    """Play one double round-robin and return the final league table"""
+    team_ids = sorted(teams)
+    table = empty_table(team_ids)
+
+    for index, (home_id, away_id) in enumerate(double_round_robin(team_ids)):
+        engine = MatchEngine(teams[home_id], teams[away_id],
+                             tactics.get(home_id), tactics.get(away_id),
+                             rng=match_rng(seed, season, index))
+        home_score, away_score, _, _ = engine.simulate_match()
+        record_result(table, home_id, away_id, home_score, away_score)
+
+    return table
+
+
+def _init_worker(teams, tactics):
+    global _worker_teams, _worker_tactics
+    _worker_teams = teams
+    _worker_tactics = tactics
+
+
+def _run_chunk(seed: int, seasons: range) -> Tuple[Dict[int, List[int]], Dict[int, Dict], Dict]:
+    """Simulate a block of seasons inside a worker and aggregate the outcome"""
+    ratings_cache.reset_stats()
+    team_ids = sorted(_worker_teams)
+    positions = {team_id: [0] * len(team_ids) for team_id in team_ids}
+    totals = empty_table(team_ids)
+
+    for season in seasons:
+        table = simulate_season(_worker_teams, _worker_tactics, seed, season)
+        for position, team_id in enumerate(standings(table)):
+            positions[team_id][position] += 1
+        for team_id, row in table.items():
+            for field in TABLE_FIELDS:
+                totals[team_id][field] += row[field]
+
+    return positions, totals, ratings_cache.stats()
+
+
+def run_monte_carlo(teams: Dict[int, Dict], tactics: Optional[Dict[int, Dict]] = None,
+                    repetitions: int = 1000, seed: int = 0,
+                    workers: Optional[int] = None, chunk_size: Optional[int] = None) -> Dict:
+    """Simulate ``repetitions`` seasons across processes.
+
+    Returns the average league table and, for every team, the probability of
+    finishing in each position.
+    """
+    if repetitions < 1:
+        raise ValueError(f"repetitions must be at least 1, got {repetitions}")
+    tactics = tactics or {}
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        # A few chunks per worker balances load without flooding the pool
+        chunk_size = max(1, repetitions // (workers * 4))
+
+    chunks = [range(start, min(start + chunk_size, repetitions))
+              for start in range(0, repetitions, chunk_size)]
+
+    team_ids = sorted(teams)
+    positions = {team_id: [0] * len(team_ids) for team_id in team_ids}
+    totals = empty_table(team_ids)
+    cache = {"hits": 0, "misses": 0, "max_bytes": 0}
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(teams, tactics)) as executor:
+        for chunk_positions, chunk_totals, chunk_cache in executor.map(
+                _run_chunk, [seed] * len(chunks), chunks):
+            cache["hits"] += chunk_cache["hits"]
+            cache["misses"] += chunk_cache["misses"]
+            cache["max_bytes"] = max(cache["max_bytes"], chunk_cache["bytes"])
+            for team_id in team_ids:
+                for position, count in enumerate(chunk_positions[team_id]):
+                    positions[team_id][position] += count
+                for field in TABLE_FIELDS:
+                    totals[team_id][field] += chunk_totals[team_id][field]
+
+    average_table = []
+    for team_id in standings(totals):
+        row = {"team_id": team_id, "name": teams[team_id]["name"]}
+        row.update({field: totals[team_id][field] / repetitions for field in TABLE_FIELDS})
+        average_table.append(row)
+
+    return {
+        "seasons": repetitions,
+        "average_table": average_table,
+        "position_distribution": {
+            team_id: [count / repetitions for count in counts]
+            for team_id, counts in positions.items()
+        },
+        # Summed over chunks; max_bytes is the largest cache of any worker
+        "ratings_cache": {
+            **cache,
+            "hit_rate": cache["hits"] / (cache["hits"] + cache["misses"])
+            if cache["hits"] + cache["misses"] else None,
+        },
+    }
+
+
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo season simulation")
+    parser.add_argument("--teams", type=int, nargs="*",
+                        help="team ids to include (default: all teams)")
+    parser.add_argument("--repetitions", type=positive_int, default=1000,
+                        help="number of seasons to simulate")
+    parser.add_argument("--seed", type=int, default=0, help="master seed")
+    parser.add_argument("--workers", type=int, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=positive_int, help="seasons per work unit")
+    args = parser.parse_args(argv)
+
+    from database import session_scope
+    from logic.simulation import load_teams
+
+    with session_scope() as session:
+        # A bare --teams means all teams, as when it is omitted
+        teams, tactics = load_teams(session, args.teams or None)
+
+    start = time.perf_counter()
+    result = run_monte_carlo(teams, tactics, args.repetitions, args.seed,
+                             args.workers, args.chunk_size)
+    result["seconds"] = time.perf_counter() - start
+
+    json.dump(result, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
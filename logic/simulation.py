@@ -0,0 +1,202 @@
+"""Headless (Qt-free) match simulation.
+
+Fixtures use the same team/tactics dict shape that
+``main.FootballManager.start_match`` hands to ``MatchView``, so anything the
+UI can play can also be simulated in bulk on a server without a display.
+
+Run ``python -m logic.simulation --help`` for the command line entry point.
+"""
+import argparse
+import json
+import sys
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from logic.match_engine import MatchEngine
+from logic.ratings_cache import ratings_cache
+from logic.rng import match_rng, numpy_rng
+from logic.squad import load_squads
+from logic.tactics import load_default_tactics
+
+
+def make_fixture(home_team, away_team, home_tactics=None, away_tactics=None) -> Dict:
+    """Bundle two team dicts (and optional tactics dicts) into a fixture"""
+    return {
+        "home_team": home_team,
+        "away_team": away_team,
+        "home_tactics": home_tactics,
+        "away_tactics": away_tactics,
+    }
+
+
+def make_engine(fixture: Dict, rng=None, engine_class=MatchEngine) -> MatchEngine:
+    """Create a ``MatchEngine`` (or subclass) for a fixture"""
+    return engine_class(
+        fixture["home_team"],
+        fixture["away_team"],
+        fixture.get("home_tactics"),
+        fixture.get("away_tactics"),
+        rng=rng,
+    )
+
+
+def simulate_fixture(fixture: Dict, include_events: bool = True, rng=None,
+                     engine_class=MatchEngine) -> Dict:
+    """Simulate a single fixture to full time and return its result"""
+    engine = make_engine(fixture, rng, engine_class)
+    engine.simulate_match()
+    return engine_result(engine, include_events)
+
+
+def engine_result(engine: MatchEngine, include_events: bool = True) -> Dict:
+    """Snapshot the current state of a ``MatchEngine`` as a result dict"""
+    return {
+        "home_team_id": engine.home_team["id"],
+        "away_team_id": engine.away_team["id"],
+        "home_score": engine.home_score,
+        "away_score": engine.away_score,
+        "events": engine.events if include_events else [],
+        "stats": {
+            "possession": engine.possession,
+            "shots": engine.shots
+        },
+    }
+
+
+def simulate_fixtures(fixtures: Iterable[Dict], include_events: bool = True,
+                      seed: Optional[int] = None, engine_class=MatchEngine) -> List[Dict]:
+    """Simulate a batch of fixtures sequentially, preserving input order.
+
+    With a ``seed`` every fixture gets its own stream derived from the seed
+    and its position in the batch, making the whole batch reproducible.
+    ``engine_class`` may be e.g. ``logic.event_engine.EventDrivenMatchEngine``.
+    """
+    return [
+        simulate_fixture(fixture, include_events,
+                         match_rng(seed, index) if seed is not None else None, engine_class)
+        for index, fixture in enumerate(fixtures)
+    ]
+
+
+def stream_fixtures(fixtures: Iterable[Dict], seed: Optional[int] = None,
+                    engine_class=MatchEngine) -> Iterator[Tuple[int, object]]:
+    """Simulate fixtures one after another, yielding ``(index, event)`` pairs.
+
+    Events are typed (see ``logic.events``) and each match ends with its
+    ``FullTimeEvent``. Nothing is accumulated, so ``fixtures`` may be a
+    generator of any length. Seeds match ``simulate_fixtures``.
+    """
+    for index, fixture in enumerate(fixtures):
+        engine = make_engine(fixture, match_rng(seed, index) if seed is not None else None,
+                             engine_class)
+        for event in engine.stream():
+            yield index, event
+
+
+def load_teams(session, team_ids: Optional[List[int]] = None) -> Tuple[Dict, Dict]:
+    """Load engine-ready squads and each team's default tactics by team id.
+
+    Two Core queries in total; teams are ``Squad`` and tactics ``Tactics``
+    snapshots, both immutable.
+    """
+    return load_squads(session, team_ids), load_default_tactics(session, team_ids)
+
+
+def load_fixtures(session, pairs: Iterable[Tuple[int, int]]) -> List[Dict]:
+    """Engine-ready fixtures for ``(home_team_id, away_team_id)`` pairs.
+
+    All squads and default tactics are fetched together, so a whole match
+    day or season costs two queries; fixtures share the snapshots of a team.
+    """
+    pairs = list(pairs)
+    if not pairs:
+        return []
+    teams, tactics = load_teams(session, sorted({team_id for pair in pairs for team_id in pair}))
+    return [
+        make_fixture(teams[home_id], teams[away_id], tactics.get(home_id), tactics.get(away_id))
+        for home_id, away_id in pairs
+    ]
+
+
+def load_round_robin(session, team_ids: Optional[List[int]] = None) -> List[Dict]:
+    """Build a double round-robin fixture list from teams in the database"""
+    teams, tactics = load_teams(session, team_ids)
+    return [
+        make_fixture(teams[home_id], teams[away_id], tactics.get(home_id), tactics.get(away_id))
+        for home_id in teams
+        for away_id in teams
+        if home_id != away_id
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate matches without the GUI")
+    parser.add_argument("--teams", type=int, nargs="*",
+                        help="team ids to include (default: all teams)")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="number of times to play the fixture list")
+    parser.add_argument("--no-events", action="store_true",
+                        help="omit per-match events from the output")
+    engines = parser.add_mutually_exclusive_group()
+    engines.add_argument("--vectorized", action="store_true",
+                         help="use the NumPy engine that simulates all matches in lockstep")
+    engines.add_argument("--event-driven", action="store_true",
+                         help="use the engine that jumps between events instead of playing every minute")
+    parser.add_argument("--seed", type=int, help="master seed for reproducible results")
+    parser.add_argument("--save", action="store_true",
+                        help="store the results in the matches/match_events tables")
+    parser.add_argument("--summary", action="store_true",
+                        help="print only timing information")
+    parser.add_argument("--stream", action="store_true",
+                        help="print events as JSON lines while matches are played")
+    args = parser.parse_args(argv)
+    if args.stream and args.vectorized:
+        parser.error("--stream plays matches one by one and cannot be combined with --vectorized")
+
+    from database import session_scope
+
+    with session_scope() as session:
+        # A bare --teams means all teams, as when it is omitted
+        fixtures = load_round_robin(session, args.teams or None)
+
+    engine_class = MatchEngine
+    if args.event_driven:
+        from logic.event_engine import EventDrivenMatchEngine as engine_class
+
+    if args.stream:
+        for index, event in stream_fixtures(
+                (fixture for _ in range(args.repeat) for fixture in fixtures), args.seed,
+                engine_class):
+            json.dump({"match": index, **event.to_dict()}, sys.stdout)
+            sys.stdout.write("\n")
+        return
+
+    start = time.perf_counter()
+    if args.vectorized:
+        from logic.vectorized_engine import simulate_fixtures_vectorized
+        rng = numpy_rng(args.seed) if args.seed is not None else None
+        results = simulate_fixtures_vectorized(fixtures * args.repeat,
+                                               include_events=not args.no_events, rng=rng)
+    else:
+        results = simulate_fixtures(fixtures * args.repeat, include_events=not args.no_events,
+                                    seed=args.seed, engine_class=engine_class)
+    elapsed = time.perf_counter() - start
+
+    if args.save:
+        from database import save_match_results
+        save_match_results(results)
+
+    if args.summary:
+        json.dump({
+            "matches": len(results),
+            "seconds": elapsed,
+            "matches_per_second": len(results) / elapsed if elapsed else None,
+            "ratings_cache": ratings_cache.stats(),
+        }, sys.stdout, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
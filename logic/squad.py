@@ -0,0 +1,138 @@
+"""Compact, array-backed squads for the match engines.
+
+A ``Squad`` keeps a team's ``(id, name)`` pairs and positions in tuples and
+the five ratings in one NumPy structured array (5 bytes per player) instead of a
+dict per player. ``MatchEngine`` and ``VectorizedMatchEngine`` accept a
+``Squad`` anywhere they accept a team dict; ``squad["id"]``,
+``squad["name"]`` and ``squad["players"]`` still work for code that only
+reads team dicts (the latter builds the dicts on every call).
+
+Squads from ``load_squads`` carry the team's tactics/roster version so
+``logic.ratings_cache`` can reuse their ratings across matches.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+RATINGS = ("attack", "defense", "stamina", "speed", "technique")
+RATINGS_DTYPE = np.dtype([(rating, np.uint8) for rating in RATINGS])
+
+
+class Squad:
+    __slots__ = ("id", "name", "members", "positions", "ratings", "version", "_strength")
+
+    def __init__(self, team_id: int, name: str, members: Iterable[Tuple[int, str]],
+                 ratings: np.ndarray, positions: Optional[Iterable[Optional[str]]] = None,
+                 version: Optional[Tuple[int, int]] = None):
+        self.id = team_id
+        self.name = name
+        # (id, name) and position per player, in the same order as ``ratings``
+        self.members = tuple(members)
+        self.positions = tuple(positions) if positions is not None else (None,) * len(self.members)
+        self.ratings = np.asarray(ratings, dtype=RATINGS_DTYPE)
+        self.ratings.flags.writeable = False
+        # Tactics/roster version at load time; None for squads built in memory
+        self.version = version
+        self._strength = None
+
+    @classmethod
+    def from_rows(cls, team_id: int, name: str, rows: Iterable[Tuple],
+                  version: Optional[Tuple[int, int]] = None) -> "Squad":
+        """Build from ``(id, name, position, attack, defense, stamina, speed, technique)`` rows"""
+        rows = list(rows)
+        return cls(
+            team_id,
+            name,
+            [(row[0], row[1]) for row in rows],
+            np.array([tuple(value or 0 for value in row[3:]) for row in rows], dtype=RATINGS_DTYPE),
+            [row[2] for row in rows],
+            version,
+        )
+
+    @classmethod
+    def from_team_dict(cls, team: Dict) -> "Squad":
+        return cls.from_rows(team["id"], team["name"], (
+            (player["id"], player["name"], player.get("position"),
+             *(player[rating] for rating in RATINGS))
+            for player in team["players"]
+        ))
+
+    def __len__(self):
+        return len(self.members)
+
+    def __getitem__(self, key):
+        # Read-only team dict compatibility
+        if key == "id":
+            return self.id
+        if key == "name":
+            return self.name
+        if key == "players":
+            return self.to_dict()["players"]
+        raise KeyError(key)
+
+    def __repr__(self):
+        return f"Squad(id={self.id!r}, name={self.name!r}, players={len(self)})"
+
+    def strength(self) -> float:
+        """Average of the players' mean ratings, as ``logic.strength.squad_average``"""
+        if self._strength is None:
+            total_strength = 0
+            # Same summation order as the dict version, so results match exactly
+            for attack, defense, stamina, speed, technique in self.ratings.tolist():
+                total_strength += (attack + defense + stamina + speed + technique) / 5
+            self._strength = total_strength / len(self) if len(self) else 0
+        return self._strength
+
+    def replace_player(self, player_out_id: int, player_in: Dict) -> "Squad":
+        """Return a copy with ``player_in`` (a player dict) in place of ``player_out_id``"""
+        for index, (player_id, _) in enumerate(self.members):
+            if player_id == player_out_id:
+                break
+        else:
+            raise ValueError(f"Player {player_out_id} is not playing for {self.name}")
+        ratings = self.ratings.copy()
+        ratings[index] = tuple(player_in[rating] for rating in RATINGS)
+        members = list(self.members)
+        members[index] = (player_in["id"], player_in["name"])
+        positions = list(self.positions)
+        positions[index] = player_in.get("position")
+        return Squad(self.id, self.name, members, ratings, positions)
+
+    def to_dict(self) -> Dict:
+        """Equivalent plain team dict: ``id``, ``name`` and ``players`` with position and ratings"""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "players": [
+                {"id": player_id, "name": player_name, "position": position,
+                 **dict(zip(RATINGS, ratings))}
+                for (player_id, player_name), position, ratings
+                in zip(self.members, self.positions, self.ratings.tolist())
+            ],
+        }
+
+
+def load_squads(session, team_ids: Optional[List[int]] = None) -> Dict[int, Squad]:
+    """Load squads by team id (all teams if None) with one Core query, without ORM objects"""
+    from sqlalchemy import select
+    from database.models import Player, Team
+    from logic.ratings_cache import ratings_cache
+
+    query = (
+        select(Team.id, Team.name, Player.id, Player.name, Player.position,
+               *(getattr(Player, rating) for rating in RATINGS))
+        .join(Player, Player.team_id == Team.id, isouter=True)
+        .order_by(Team.id, Player.id)
+    )
+    if team_ids is not None:
+        query = query.where(Team.id.in_(team_ids))
+
+    teams = {}
+    for row in session.execute(query):
+        team = teams.setdefault(row[0], (row[1], []))
+        if row[2] is not None:
+            team[1].append(tuple(row[2:]))
+    return {
+        team_id: Squad.from_rows(team_id, name, rows, ratings_cache.version(team_id))
+        for team_id, (name, rows) in teams.items()
+    }
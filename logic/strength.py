@@ -0,0 +1,187 @@
+"""Tactics-aware team strength.
+
+``line_ratings`` rates a side's attack, midfield and defence for one
+squad and tactic. Players are put in a line (goalkeeper, defence,
+midfield, attack) by where they were placed on the tactics pitch, else by
+their role, else by their position. Each line of the formation is filled
+with its best players, scored with their role's attribute weights, and
+players borrowed from another line count for ``OUT_OF_POSITION`` of their
+score. The match engines compute this once per side and only look the
+three numbers up per minute.
+
+Without tactics every line is rated at the plain squad average
+(``squad_average``), so such matches play exactly as
+before tactics were taken into account.
+"""
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from logic.squad import RATINGS, Squad
+from logic.tactics import FORMATIONS, Tactics
+
+LINES = ("GK", "D", "M", "F")
+# Ties between equally empty lines go to midfield (possession) and attack first
+BORROW_ORDER = ("M", "F", "D", "GK")
+DEFAULT_FORMATION = "4-4-2"
+OUT_OF_POSITION = 0.8
+# Rating change per player above (or below) a 4-4-2 in a line
+LINE_SIZE_EFFECT = 0.05
+
+# Attribute weights in RATINGS order: attack, defense, stamina, speed, technique
+LINE_WEIGHTS = {
+    "GK": (0.0, 0.6, 0.0, 0.2, 0.2),
+    "D": (0.0, 0.6, 0.2, 0.2, 0.0),
+    "M": (0.15, 0.15, 0.3, 0.0, 0.4),
+    "F": (0.6, 0.0, 0.0, 0.2, 0.2),
+}
+# Line and attribute weights of the roles offered by TacticsView
+ROLES = {
+    "Goalkeeper": ("GK", (0.0, 0.7, 0.0, 0.1, 0.2)),
+    "Sweeper Keeper": ("GK", (0.0, 0.5, 0.0, 0.25, 0.25)),
+    "Centre-Back": ("D", (0.0, 0.6, 0.2, 0.2, 0.0)),
+    "Full-Back": ("D", (0.0, 0.45, 0.2, 0.35, 0.0)),
+    "Wing-Back": ("D", (0.15, 0.3, 0.2, 0.35, 0.0)),
+    "Ball-Playing Defender": ("D", (0.0, 0.5, 0.2, 0.0, 0.3)),
+    "Libero": ("D", (0.0, 0.4, 0.0, 0.3, 0.3)),
+    "Central Midfielder": ("M", (0.15, 0.2, 0.3, 0.0, 0.35)),
+    "Defensive Midfielder": ("M", (0.0, 0.45, 0.3, 0.0, 0.25)),
+    "Attacking Midfielder": ("M", (0.35, 0.0, 0.0, 0.2, 0.45)),
+    "Box-to-Box": ("M", (0.2, 0.2, 0.4, 0.0, 0.2)),
+    "Deep-Lying Playmaker": ("M", (0.0, 0.2, 0.2, 0.0, 0.6)),
+    "Wide Midfielder": ("M", (0.0, 0.0, 0.3, 0.35, 0.35)),
+    "Winger": ("M", (0.2, 0.0, 0.0, 0.45, 0.35)),
+    "Target Man": ("F", (0.5, 0.0, 0.3, 0.0, 0.2)),
+    "Poacher": ("F", (0.7, 0.0, 0.0, 0.3, 0.0)),
+    "Complete Forward": ("F", (0.4, 0.0, 0.0, 0.3, 0.3)),
+    "False Nine": ("F", (0.3, 0.0, 0.0, 0.2, 0.5)),
+    "Inside Forward": ("F", (0.4, 0.0, 0.0, 0.35, 0.25)),
+    "Advanced Forward": ("F", (0.5, 0.0, 0.2, 0.3, 0.0)),
+}
+POSITION_LINES = {"Goalkeeper": "GK", "Defender": "D", "Midfielder": "M", "Forward": "F"}
+
+
+class LineRatings(NamedTuple):
+    attack: float
+    midfield: float
+    defense: float
+
+
+def pitch_line(x: float) -> str:
+    """Line of a spot on the TacticsView pitch (attacking left to right)"""
+    if x < 140:
+        return "GK"
+    if x < 300:
+        return "D"
+    if x < 550:
+        return "M"
+    return "F"
+
+
+def _formation_slots(layout) -> Dict[str, int]:
+    slots = dict.fromkeys(LINES, 0)
+    for group in layout:
+        for x, _ in group:
+            slots[pitch_line(x)] += 1
+    return slots
+
+
+# Players per line of every formation, worked out once
+FORMATION_SLOTS = {formation: _formation_slots(layout) for formation, layout in FORMATIONS.items()}
+
+
+def _players(team) -> List[Tuple[int, Optional[str], Tuple[int, ...]]]:
+    """``(id, position, ratings)`` of every player of a team dict or ``Squad``"""
+    if isinstance(team, Squad):
+        return [
+            (player_id, position, tuple(ratings))
+            for (player_id, _), position, ratings
+            in zip(team.members, team.positions, team.ratings.tolist())
+        ]
+    return [
+        (player["id"], player.get("position"), tuple(player[rating] for rating in RATINGS))
+        for player in team["players"]
+    ]
+
+
+def _score(ratings, weights) -> float:
+    return sum(rating * weight for rating, weight in zip(ratings, weights))
+
+
+def squad_average(team) -> float:
+    """Average player rating of a team dict or ``Squad``, ignoring tactics"""
+    if isinstance(team, Squad):
+        return team.strength()
+    total_strength = 0
+    players = team['players']
+    for player in players:
+        total_strength += (
+            player['attack'] +
+            player['defense'] +
+            player['stamina'] +
+            player['speed'] +
+            player['technique']
+        ) / 5
+    return total_strength / len(players) if players else 0
+
+
+def line_ratings(team, tactics) -> LineRatings:
+    """Attack, midfield and defence ratings of a team dict or ``Squad`` under ``tactics``"""
+    if tactics is None:
+        strength = squad_average(team)
+        return LineRatings(strength, strength, strength)
+    if not isinstance(tactics, Tactics):
+        tactics = Tactics.from_dict(tactics)
+
+    slots = FORMATION_SLOTS.get(tactics.formation, FORMATION_SLOTS[DEFAULT_FORMATION])
+    roles = dict(tactics.player_roles)
+    placed = {player_id: pitch_line(x) for player_id, x, _ in tactics.player_positions}
+
+    # Natural line of every player; None means unknown (fits anywhere)
+    squad = []
+    for player_id, position, ratings in _players(team):
+        role = ROLES.get(roles.get(player_id))
+        if player_id in placed:
+            line = placed[player_id]
+        elif role is not None:
+            line = role[0]
+        else:
+            line = next((line for prefix, line in POSITION_LINES.items()
+                         if position and position.startswith(prefix)), None)
+        squad.append((player_id, line, ratings, role[1] if role is not None else None))
+
+    # Fill every line with its best natural players first...
+    picked = {line: [] for line in LINES}
+    used = set()
+    for line in LINES:
+        scored = sorted(
+            ((_score(ratings, weights or LINE_WEIGHTS[line]), player_id)
+             for player_id, natural, ratings, weights in squad if natural == line),
+            reverse=True,
+        )
+        for score, player_id in scored[:slots[line]]:
+            picked[line].append(score)
+            used.add(player_id)
+
+    # ...then borrow the best remaining players for the gaps, one at a time
+    # into the emptiest line, so a short squad is spread over every line
+    # instead of filling goal and defence first
+    remaining = [player for player in squad if player[0] not in used]
+    while remaining:
+        open_lines = [line for line in BORROW_ORDER if len(picked[line]) < slots[line]]
+        if not open_lines:
+            break
+        line = min(open_lines, key=lambda line: len(picked[line]) / slots[line])
+        score, index = max(
+            (_score(ratings, LINE_WEIGHTS[line]) * (1 if natural is None else OUT_OF_POSITION), index)
+            for index, (_, natural, ratings, _) in enumerate(remaining)
+        )
+        picked[line].append(score)
+        del remaining[index]
+
+    average = {line: sum(scores) / len(scores) if scores else 0.0 for line, scores in picked.items()}
+    return LineRatings(
+        attack=(0.7 * average["F"] + 0.3 * average["M"])
+        * (1 + LINE_SIZE_EFFECT * (slots["F"] - 2)),
+        midfield=average["M"] * (1 + LINE_SIZE_EFFECT * (slots["M"] - 4)),
+        defense=(0.5 * average["D"] + 0.25 * average["GK"] + 0.25 * average["M"])
+        * (1 + LINE_SIZE_EFFECT * (slots["D"] - 4)),
+    )
@@ -0,0 +1,180 @@
+"""Formations and immutable tactics snapshots for the match engines.
+
+``Tactics`` is the frozen counterpart of a ``TeamTactics`` row, safe to
+share between fixtures, threads and worker processes. Like ``Squad`` it
+can stand in for a plain tactics dict: ``tactics["formation"]``,
+``["player_positions"]`` and ``["player_roles"]`` return the column values
+(JSON keyed by player id string).
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+# Slot coordinates per formation on the 800x500 TacticsView pitch (attacking
+# left to right), listed from the front line back to the goalkeeper
+FORMATIONS = {
+    "4-4-2": [
+        # Strikers
+        [(600, 150), (600, 350)],
+        # Midfielders
+        [(450, 100), (450, 200), (450, 300), (450, 400)],
+        # Defenders
+        [(200, 100), (200, 200), (200, 300), (200, 400)],
+        # Goalkeeper
+        [(80, 250)],
+    ],
+    "4-4-2 Diamond": [
+        # Strikers
+        [(600, 150), (600, 350)],
+        # Midfielders (Diamond: CAM, 2xCM, CDM)
+        [(500, 250), (450, 150), (450, 350), (400, 250)],
+        # Defenders
+        [(200, 100), (200, 200), (200, 300), (200, 400)],
+        # Goalkeeper
+        [(80, 250)],
+    ],
+    "4-3-3": [
+        # Strikers
+        [(600, 150), (600, 250), (600, 350)],
+        # Midfielders
+        [(450, 150), (450, 250), (450, 350)],
+        # Defenders
+        [(200, 100), (200, 200), (200, 300), (200, 400)],
+        # Goalkeeper
+        [(80, 250)],
+    ],
+    "4-3-3 Holding": [
+        # Strikers
+        [(600, 150), (600, 250), (600, 350)],
+        # Midfielders (2 CM, 1 CDM)
+        [(500, 175), (500, 325), (400, 250)],
+        # Defenders
+        [(200, 100), (200, 200), (200, 300), (200, 400)],
+        # Goalkeeper
+        [(80, 250)],
+    ],
+    "4-2-3-1": [
+        # Striker
+        [(600, 250)],
+        # Attacking Midfielders
+        [(500, 150), (500, 250), (500, 350)],
+        # Defensive Midfielders
+        [(400, 175), (400, 325)],
+        # Defenders
+        [(200, 100), (200, 200), (200, 300), (200, 400)],
+        # Goalkeeper
+        [(80, 250)],
+    ],
+    "3-5-2": [
+        # Strikers
+        [(600, 150), (600, 350)],
+        # Midfielders
+        [(450, 100), (450, 175), (450, 250), (450, 325), (450, 400)],
+        # Defenders
+        [(200, 150), (200, 250), (200, 350)],
+        # Goalkeeper
+        [(80, 250)],
+    ],
+    "3-4-3": [
+        # Strikers
+        [(600, 150), (600, 250), (600, 350)],
+        # Midfielders
+        [(450, 125), (450, 225), (450, 325), (450, 425)],
+        # Defenders
+        [(200, 150), (200, 250), (200, 350)],
+        # Goalkeeper
+        [(80, 250)],
+    ],
+    "5-3-2": [
+        # Strikers
+        [(600, 150), (600, 350)],
+        # Midfielders
+        [(450, 150), (450, 250), (450, 350)],
+        # Defenders
+        [(200, 50), (200, 150), (200, 250), (200, 350), (200, 450)],
+        # Goalkeeper
+        [(80, 250)],
+    ],
+    "4-5-1": [
+        # Striker
+        [(600, 250)],
+        # Midfielders
+        [(450, 50), (450, 150), (450, 250), (450, 350), (450, 450)],
+        # Defenders
+        [(200, 100), (200, 200), (200, 300), (200, 400)],
+        # Goalkeeper
+        [(80, 250)],
+    ],
+    "4-1-4-1": [
+        # Striker
+        [(600, 250)],
+        # Advanced Midfielders
+        [(500, 100), (500, 200), (500, 300), (500, 400)],
+        # Defensive Midfielder
+        [(400, 250)],
+        # Defenders
+        [(200, 100), (200, 200), (200, 300), (200, 400)],
+        # Goalkeeper
+        [(80, 250)],
+    ],
+}
+
+
+@dataclass(frozen=True)
+class Tactics:
+    formation: Optional[str]
+    # (player id, role) and (player id, x, y), sorted by player id
+    player_roles: Tuple[Tuple[int, str], ...] = ()
+    player_positions: Tuple[Tuple[int, float, float], ...] = ()
+    name: Optional[str] = None
+    team_id: Optional[int] = None
+
+    @classmethod
+    def from_columns(cls, formation, player_positions, player_roles,
+                     name=None, team_id=None) -> "Tactics":
+        """Build from the ``TeamTactics`` column values (JSON keyed by player id string)"""
+        return cls(
+            formation=formation,
+            player_roles=tuple(sorted(
+                (int(player_id), role) for player_id, role in (player_roles or {}).items()
+            )),
+            player_positions=tuple(sorted(
+                (int(player_id), position["x"], position["y"])
+                for player_id, position in (player_positions or {}).items()
+            )),
+            name=name,
+            team_id=team_id,
+        )
+
+    @classmethod
+    def from_dict(cls, tactics: Dict) -> "Tactics":
+        return cls.from_columns(tactics.get("formation"), tactics.get("player_positions"),
+                                tactics.get("player_roles"))
+
+    def __getitem__(self, key):
+        # Read-only tactics dict compatibility
+        if key == "formation":
+            return self.formation
+        if key == "player_roles":
+            return {str(player_id): role for player_id, role in self.player_roles}
+        if key == "player_positions":
+            return {str(player_id): {"x": x, "y": y} for player_id, x, y in self.player_positions}
+        raise KeyError(key)
+
+
+def load_default_tactics(session, team_ids: Optional[List[int]] = None) -> Dict[int, Tactics]:
+    """Each team's default (first saved) tactics by team id (all teams if None), in one Core query"""
+    from sqlalchemy import func, select
+    from database.models import TeamTactics
+
+    first = select(func.min(TeamTactics.id)).group_by(TeamTactics.team_id)
+    if team_ids is not None:
+        first = first.where(TeamTactics.team_id.in_(team_ids))
+    query = select(
+        TeamTactics.team_id, TeamTactics.name, TeamTactics.formation,
+        TeamTactics.player_positions, TeamTactics.player_roles,
+    ).where(TeamTactics.id.in_(first))
+
+    return {
+        team_id: Tactics.from_columns(formation, positions, roles, name, team_id)
+        for team_id, name, formation, positions, roles in session.execute(query)
+    }
@@ -1,5 +1,13 @@
-import sys
 import os
+import sys
+import time
+from contextlib import contextmanager
+
+# Enabled before the remaining imports so that their cost is measured too
+from profiling import profiler
+
+profiler.configure(sys.argv)
+
 from PyQt5.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -12,34 +20,60 @@ from PyQt5.QtWidgets import (
     QStackedWidget,
     QComboBox,
     QDialog,
+    QShortcut,
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QKeySequence
 from ui import SquadView
 from ui.tactics_view import TacticsView
 from ui.match_view import MatchView
 from ui.team_view import TeamView
-from database import init_db, create_sample_data, get_session
-from database.models import Team, TeamTactics
+from ui.team_models import TeamListModel
+from database import init_db, create_sample_data, get_session, session_scope
+from database.models import Team
+from database import instrumentation
 from ui.styles import MAIN_STYLE
-from sqlalchemy.orm import joinedload
+from logic.simulation import load_fixtures
+
+profiler.imports_done()
+
+# Idle time after a navigation before the next view is built ahead of use
+PREFETCH_DELAY_MS = 500
 
 class FootballManager(QMainWindow):
-    def __init__(self):
+    def __init__(self, prefetch=True):
         super().__init__()
+        self.created_at = time.perf_counter()
+        self.startup_timings = {}
+        self.prefetch = prefetch
         self.setWindowTitle("Football Manager QT")
         self.setGeometry(100, 100, 1200, 800)
 
-        # Initialize database and sample data if needed
-        db_file = "football_manager.db"
-        if not os.path.exists(db_file):
+        # Create or upgrade the database in place, seeding it only when empty
+        with self.timed("database"):
             init_db()
-            create_sample_data()
+            with session_scope() as session:
+                is_empty = session.query(Team.id).first() is None
+        if is_empty:
+            with self.timed("sample_data"):
+                create_sample_data()
+
+        with self.timed("setup_ui"):
+            self.setup_ui()
+            self.show_teams()
 
-        self.setup_ui()
+    @contextmanager
+    def timed(self, phase):
+        """Record how long ``phase`` takes in ``startup_timings`` and the profiler"""
+        start = time.perf_counter()
+        with profiler.section(phase):
+            yield
+        self.startup_timings[phase] = time.perf_counter() - start
 
     def setup_ui(self):
         # Apply stylesheet
-        self.setStyleSheet(MAIN_STYLE)
+        with self.timed("stylesheet"):
+            self.setStyleSheet(MAIN_STYLE)
 
         # Create central widget and main layout
         central_widget = QWidget()
@@ -82,20 +116,43 @@ class FootballManager(QMainWindow):
         self.stacked_widget = QStackedWidget()
         main_layout.addWidget(self.stacked_widget)
 
-        # Add views
-        self.team_view = TeamView()
-        self.stacked_widget.addWidget(self.team_view)
-        
-        self.squad_view = SquadView()
-        self.stacked_widget.addWidget(self.squad_view)
+        # Views are built on first navigation; until then each slot holds an
+        # empty widget so stack indexes stay fixed
+        self.view_factories = [
+            TeamView,
+            SquadView,
+            TacticsView,
+            self.create_match_setup,
+            self.create_placeholder,  # Transfer
+            self.create_placeholder,  # Statistics
+        ]
+        self.views = {}
+        for _ in self.view_factories:
+            self.stacked_widget.addWidget(QWidget())
+        self.team_view = None
+        self.squad_view = None
+        self.tactics_view = None
+        self.teams_model = None
+
+        self.prefetch_timer = QTimer(self)
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.setInterval(PREFETCH_DELAY_MS)
+        self.prefetch_timer.timeout.connect(self.prefetch_next_view)
 
-        # Add tactics view
-        self.tactics_view = TacticsView()
-        self.stacked_widget.addWidget(self.tactics_view)
+        if instrumentation.SQL_DEBUG:
+            self.sql_debug_panel = None
+            QShortcut(QKeySequence("Ctrl+Shift+D"), self, self.show_sql_debug_panel)
 
-        # Add match view
-        self.match_setup_widget = QWidget()
-        match_setup_layout = QVBoxLayout(self.match_setup_widget)
+        # Add status bar
+        self.statusBar().showMessage("Welcome to Football Manager QT!")
+        self.statusBar().setStyleSheet(
+            "QStatusBar { background-color: #34495e; color: white; padding: 5px; }"
+        )
+
+    def create_match_setup(self):
+        """Build the match setup page with home/away team selection"""
+        match_setup_widget = QWidget()
+        match_setup_layout = QVBoxLayout(match_setup_widget)
         
         # Team selection
         teams_layout = QHBoxLayout()
@@ -127,106 +184,70 @@ class FootballManager(QMainWindow):
         start_match_btn.clicked.connect(self.start_match)
         match_setup_layout.addWidget(start_match_btn)
         
-        self.stacked_widget.addWidget(self.match_setup_widget)
-        
         # Load teams into combo boxes
         self.load_teams()
+        return match_setup_widget
 
-        # Add placeholder widgets for other views
-        for _ in range(2):  # Transfer, Statistics
-            placeholder = QWidget()
-            placeholder_layout = QVBoxLayout(placeholder)
-            label = QLabel("Coming Soon!")
-            label.setProperty("class", "header-label")
-            label.setAlignment(Qt.AlignCenter)
-            placeholder_layout.addWidget(label)
-            self.stacked_widget.addWidget(placeholder)
+    def create_placeholder(self):
+        """Build a "Coming Soon!" page for views that do not exist yet"""
+        placeholder = QWidget()
+        placeholder_layout = QVBoxLayout(placeholder)
+        label = QLabel("Coming Soon!")
+        label.setProperty("class", "header-label")
+        label.setAlignment(Qt.AlignCenter)
+        placeholder_layout.addWidget(label)
+        return placeholder
 
-        # Add status bar
-        self.statusBar().showMessage("Welcome to Football Manager QT!")
-        self.statusBar().setStyleSheet(
-            "QStatusBar { background-color: #34495e; color: white; padding: 5px; }"
-        )
+    def get_view(self, index):
+        """Return the view at ``index``, constructing it on first use"""
+        view = self.views.get(index)
+        if view is None:
+            with self.timed(f"view:{self.buttons[index][0]}"):
+                view = self.view_factories[index]()
+
+            empty = self.stacked_widget.widget(index)
+            self.stacked_widget.removeWidget(empty)
+            empty.deleteLater()
+            self.stacked_widget.insertWidget(index, view)
+            self.views[index] = view
+
+            # Keep the familiar attribute names for the main views
+            if isinstance(view, TeamView):
+                self.team_view = view
+            elif isinstance(view, SquadView):
+                self.squad_view = view
+            elif isinstance(view, TacticsView):
+                self.tactics_view = view
+        return view
+
+    def show_view(self, index, message):
+        self.stacked_widget.setCurrentWidget(self.get_view(index))
+        self.statusBar().showMessage(message)
+        # Never compete with the first paint
+        if self.prefetch and "first_paint" in self.startup_timings:
+            self.prefetch_timer.start()
+
+    def prefetch_next_view(self):
+        """Build the view to the right of the current one while the user is idle"""
+        self.get_view((self.stacked_widget.currentIndex() + 1) % len(self.view_factories))
 
     def load_teams(self):
         """Load teams into combo boxes"""
-        session = get_session()
-        teams = session.query(Team).all()
-        
-        for team in teams:
-            self.home_team_combo.addItem(team.name, team.id)
-            self.away_team_combo.addItem(team.name, team.id)
-            
-        session.close()
+        # Both combos share one lazily paged model (and its session)
+        self.teams_model = TeamListModel(get_session(), self)
+        self.home_team_combo.setModel(self.teams_model)
+        self.away_team_combo.setModel(self.teams_model)
         
     def start_match(self):
         """Start a match between selected teams"""
-        session = get_session()
-        
-        # Get selected teams using newer SQLAlchemy API
         home_team_id = self.home_team_combo.currentData()
         away_team_id = self.away_team_combo.currentData()
-        
-        # Eagerly load teams with their players and tactics
-        home_team = (
-            session.query(Team)
-            .filter_by(id=home_team_id)
-            .options(joinedload(Team.players))
-            .first()
-        )
-        away_team = (
-            session.query(Team)
-            .filter_by(id=away_team_id)
-            .options(joinedload(Team.players))
-            .first()
-        )
-        
-        # Get default tactics for each team
-        home_tactics = session.query(TeamTactics).filter_by(team_id=home_team_id).first()
-        away_tactics = session.query(TeamTactics).filter_by(team_id=away_team_id).first()
-        
-        # Create copies of the data to avoid session issues
-        home_team_data = {
-            'id': home_team.id,
-            'name': home_team.name,
-            'players': [{
-                'id': p.id,
-                'name': p.name,
-                'attack': p.attack,
-                'defense': p.defense,
-                'stamina': p.stamina,
-                'speed': p.speed,
-                'technique': p.technique
-            } for p in home_team.players]
-        }
-        
-        away_team_data = {
-            'id': away_team.id,
-            'name': away_team.name,
-            'players': [{
-                'id': p.id,
-                'name': p.name,
-                'attack': p.attack,
-                'defense': p.defense,
-                'stamina': p.stamina,
-                'speed': p.speed,
-                'technique': p.technique
-            } for p in away_team.players]
-        }
-        
-        home_tactics_data = {
-            'formation': home_tactics.formation,
-            'player_positions': home_tactics.player_positions,
-            'player_roles': home_tactics.player_roles
-        } if home_tactics else None
-        
-        away_tactics_data = {
-            'formation': away_tactics.formation,
-            'player_positions': away_tactics.player_positions,
-            'player_roles': away_tactics.player_roles
-        } if away_tactics else None
-        
-        session.close()
+        if home_team_id is None or away_team_id is None:
+            return
+
+        # Immutable squad and tactics snapshots, detached from any session
+        with session_scope() as session:
+            fixture = load_fixtures(session, [(home_team_id, away_team_id)])[0]
         
         # Create and show match dialog
         match_dialog = QDialog(self)
@@ -234,34 +255,68 @@ class FootballManager(QMainWindow):
         match_dialog.setMinimumSize(800, 600)
         
         layout = QVBoxLayout(match_dialog)
-        match_view = MatchView(home_team_data, away_team_data, home_tactics_data, away_tactics_data)
+        match_view = MatchView(fixture["home_team"], fixture["away_team"],
+                               fixture["home_tactics"], fixture["away_tactics"])
         layout.addWidget(match_view)
         
         match_dialog.exec_()
+        match_view.stop_worker()
 
     def show_teams(self):
-        self.stacked_widget.setCurrentIndex(0)
-        self.statusBar().showMessage("Team Management")
+        self.show_view(0, "Team Management")
 
     def show_squad(self):
-        self.stacked_widget.setCurrentIndex(1)
-        self.statusBar().showMessage("Squad Management")
+        self.show_view(1, "Squad Management")
 
     def show_tactics(self):
-        self.stacked_widget.setCurrentIndex(2)
-        self.statusBar().showMessage("Team Tactics")
+        self.show_view(2, "Team Tactics")
 
     def show_match(self):
-        self.stacked_widget.setCurrentIndex(3)
-        self.statusBar().showMessage("Match Center")
+        self.show_view(3, "Match Center")
 
     def show_transfer(self):
-        self.stacked_widget.setCurrentIndex(4)
-        self.statusBar().showMessage("Transfer Market - Coming Soon!")
+        self.show_view(4, "Transfer Market - Coming Soon!")
 
     def show_statistics(self):
-        self.stacked_widget.setCurrentIndex(5)
-        self.statusBar().showMessage("Statistics - Coming Soon!")
+        self.show_view(5, "Statistics - Coming Soon!")
+
+    def show_sql_debug_panel(self):
+        """Open the SQL statistics window (FOOTBALL_MANAGER_SQL_DEBUG=1 only)"""
+        from ui.sql_debug_panel import SqlDebugPanel
+
+        if self.sql_debug_panel is None:
+            self.sql_debug_panel = SqlDebugPanel(self)
+        self.sql_debug_panel.show()
+        self.sql_debug_panel.raise_()
+
+    def closeEvent(self, event):
+        # The team combos' model and the views keep their sessions open for
+        # lazy paging and edits, so release them with the window
+        if self.teams_model is not None:
+            self.teams_model.session.close()
+        for view in self.views.values():
+            session = getattr(view, "session", None)
+            if session is not None:
+                session.close()
+        super().closeEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if "first_paint" not in self.startup_timings:
+            # Runs after the first frame has been painted
+            QTimer.singleShot(0, self.report_startup)
+
+    def report_startup(self):
+        self.startup_timings["first_paint"] = time.perf_counter() - self.created_at
+        if os.environ.get("FOOTBALL_MANAGER_STARTUP_REPORT"):
+            report = ", ".join(f"{phase}={seconds * 1000:.1f}ms"
+                               for phase, seconds in self.startup_timings.items())
+            print(f"Startup: {report}", file=sys.stderr)
+        profiler.dump()
+        if profiler.quit_after_startup:
+            QApplication.quit()
+        elif self.prefetch:
+            self.prefetch_timer.start()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,154 @@
+"""Startup profiler for the desktop app.
+
+Enable with ``python main.py --profile-startup [PATH]`` or by setting
+``FOOTBALL_MANAGER_PROFILE=PATH``. Once the main window has painted, a
+JSON report is written to PATH (stderr when PATH is ``-`` or omitted) with
+
+- ``phases``: seconds spent in each startup phase (database setup,
+  stylesheet, view construction, ...)
+- ``sql``: statement count, seconds and failed statements per phase, so a
+  view that starts querying on construction shows up under its own name
+- ``imports``: self time per top-level package imported after the
+  profiler was enabled
+
+Add ``--quit-after-startup`` to exit once the report is written, e.g. from
+``benchmarks/startup.py``. This module only imports the standard library so
+that it can be enabled before PyQt5 and SQLAlchemy are imported.
+"""
+import builtins
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+PROFILE_ENV = "FOOTBALL_MANAGER_PROFILE"
+PROFILE_FLAG = "--profile-startup"
+QUIT_FLAG = "--quit-after-startup"
+
+
+class StartupProfiler:
+    def __init__(self):
+        self.enabled = False
+        self.quit_after_startup = False
+        self.output = "-"
+        self.started_at = time.perf_counter()
+        self.phases = {}
+        self.imports = {}
+        self.sql = {}
+        self._section = "other"
+        self._import_stack = []
+        self._original_import = None
+
+    def configure(self, argv):
+        """Enable profiling from the environment or command line flags.
+
+        The profiler's own flags are removed from ``argv`` in place.
+        """
+        output = os.environ.get(PROFILE_ENV)
+        if PROFILE_FLAG in argv:
+            position = argv.index(PROFILE_FLAG)
+            output = "-"
+            if position + 1 < len(argv) and not argv[position + 1].startswith("--"):
+                output = argv.pop(position + 1)
+            argv.pop(position)
+        if QUIT_FLAG in argv:
+            argv.remove(QUIT_FLAG)
+            self.quit_after_startup = True
+        if output:
+            self.enable(output)
+
+    def enable(self, output="-"):
+        self.enabled = True
+        self.output = output
+        self.started_at = time.perf_counter()
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # Relative and repeated imports are charged to the importing package
+        if level or name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+        self._import_stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._import_stack.pop()
+            if self._import_stack:
+                self._import_stack[-1] += elapsed
+            package = name.partition(".")[0]
+            self.imports[package] = self.imports.get(package, 0.0) + elapsed - children
+
+    def imports_done(self):
+        """Stop timing imports and start counting SQL statements"""
+        if not self.enabled:
+            return
+        builtins.__import__ = self._original_import
+        self.phases["imports"] = time.perf_counter() - self.started_at
+
+        from sqlalchemy import event
+        from sqlalchemy.engine import Engine
+
+        # Listening on the class covers engines created later on as well
+        event.listen(Engine, "before_cursor_execute", self._before_execute)
+        event.listen(Engine, "after_cursor_execute", self._after_execute)
+        event.listen(Engine, "handle_error", self._handle_error)
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("profiler_start", []).append(time.perf_counter())
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["profiler_start"].pop()
+        stats = self.sql.setdefault(self._section, {"statements": 0, "seconds": 0.0, "failures": 0})
+        stats["statements"] += 1
+        stats["seconds"] += elapsed
+
+    def _handle_error(self, context):
+        # Failed statements skip after_cursor_execute; drop their start time
+        starts = context.connection.info.get("profiler_start") if context.connection else None
+        if not starts or context.statement is None:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        stats = self.sql.setdefault(self._section, {"statements": 0, "seconds": 0.0, "failures": 0})
+        stats["statements"] += 1
+        stats["seconds"] += elapsed
+        stats["failures"] += 1
+
+    @contextmanager
+    def section(self, name):
+        """Time a startup phase and charge the SQL it runs to ``name``"""
+        if not self.enabled:
+            yield
+            return
+        outer = self._section
+        self._section = name
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+            self._section = outer
+
+    def report(self):
+        return {
+            "first_paint_seconds": time.perf_counter() - self.started_at,
+            "phases": self.phases,
+            "sql": self.sql,
+            "imports": dict(sorted(self.imports.items(), key=lambda item: -item[1])),
+        }
+
+    def dump(self):
+        """Write the report as JSON to the configured output"""
+        if not self.enabled:
+            return
+        text = json.dumps(self.report(), indent=2)
+        if self.output == "-":
+            print(text, file=sys.stderr)
+        else:
+            with open(self.output, "w") as report_file:
+                report_file.write(text + "\n")
+
+
+profiler = StartupProfiler()
@@ -1,17 +1,125 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QPushButton, QProgressBar, QListWidget)
-from PyQt5.QtCore import Qt, QTimer
-from logic.match_engine import MatchEngine
+                             QPushButton, QProgressBar, QListWidget, QMessageBox)
+from PyQt5.QtCore import Qt, QTimer, QObject, QThread, pyqtSignal, pyqtSlot
+from logic.match_engine import MatchEngine, MATCH_MINUTES
+from logic.simulation import engine_result
+from database import save_match_results
+
+
+class MatchWorker(QObject):
+    """Runs a MatchEngine on a background thread and reports progress by signal"""
+    minute_played = pyqtSignal(dict)  # minute, scores and possession
+    event_occurred = pyqtSignal(dict)
+    match_finished = pyqtSignal(dict)  # full result, after the save was attempted
+    save_failed = pyqtSignal(str)  # error message; the result was not stored
+
+    def __init__(self, match_engine, interval=1000):
+        super().__init__()
+        self.match_engine = match_engine
+        self.interval = interval
+        self.timer = None
+        self.finished = False
+
+    @pyqtSlot()
+    def start(self):
+        # Created lazily so the timer lives in the worker thread
+        if self.timer is None:
+            self.timer = QTimer(self)
+            self.timer.timeout.connect(self.play_minute)
+        self.timer.start(self.interval)
+
+    @pyqtSlot()
+    def pause(self):
+        if self.timer is not None:
+            self.timer.stop()
+
+    @pyqtSlot()
+    def fast_forward(self):
+        """Simulate all remaining minutes at once"""
+        self.pause()
+        if self.finished:
+            return
+        while self.match_engine.current_minute < MATCH_MINUTES:
+            self.play_minute(report_minute=False)
+        self.report_minute()
+        self.finish()
+
+    @pyqtSlot()
+    def play_minute(self, report_minute=True):
+        if self.match_engine.current_minute >= MATCH_MINUTES:
+            return
+
+        event = self.match_engine.simulate_minute()
+        if event:
+            self.event_occurred.emit(event)
+        if report_minute:
+            self.report_minute()
+            if self.match_engine.current_minute >= MATCH_MINUTES:
+                self.finish()
+
+    def report_minute(self):
+        self.minute_played.emit({
+            "minute": self.match_engine.current_minute,
+            "home_score": self.match_engine.home_score,
+            "away_score": self.match_engine.away_score,
+            "home_possession": self.match_engine.possession["home"],
+        })
+
+    def finish(self):
+        # Instant Result can still be queued after full time was reached
+        if self.finished:
+            return
+        self.finished = True
+        self.pause()
+        result = engine_result(self.match_engine)
+        try:
+            save_match_results([result])
+        except Exception as e:
+            # An exception escaping a slot would abort the whole app
+            self.save_failed.emit(str(e))
+        self.match_finished.emit(result)
+
 
 class MatchView(QWidget):
+    # Control requests, delivered to the worker thread as queued calls
+    start_requested = pyqtSignal()
+    pause_requested = pyqtSignal()
+    fast_forward_requested = pyqtSignal()
+
     def __init__(self, home_team, away_team, home_tactics, away_tactics):
         super().__init__()
         self.home_team = home_team
         self.away_team = away_team
         self.match_engine = MatchEngine(home_team, away_team, home_tactics, away_tactics)
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_match)
         self.init_ui()
+        self.init_worker()
+
+    def init_worker(self):
+        self.worker_thread = QThread(self)
+        self.worker = MatchWorker(self.match_engine)
+        self.worker.moveToThread(self.worker_thread)
+
+        self.start_requested.connect(self.worker.start)
+        self.pause_requested.connect(self.worker.pause)
+        self.fast_forward_requested.connect(self.worker.fast_forward)
+        self.worker.minute_played.connect(self.update_match)
+        self.worker.event_occurred.connect(self.add_event)
+        self.worker.match_finished.connect(self.finish_match)
+        self.worker.save_failed.connect(self.show_save_error)
+
+        self.worker_thread.finished.connect(self.worker.deleteLater)
+        self.worker_thread.start()
+
+    def stop_worker(self):
+        """Stop the background thread; call before discarding the view"""
+        if self.worker_thread.isRunning():
+            self.pause_requested.emit()
+            self.worker_thread.quit()
+            self.worker_thread.wait()
+
+    def closeEvent(self, event):
+        self.stop_worker()
+        super().closeEvent(event)
         
     def init_ui(self):
         layout = QVBoxLayout()
@@ -55,49 +163,58 @@ class MatchView(QWidget):
         self.pause_button = QPushButton("Pause")
         self.pause_button.clicked.connect(self.pause_match)
         self.pause_button.setEnabled(False)
+        self.instant_button = QPushButton("Instant Result")
+        self.instant_button.clicked.connect(self.instant_result)
         
         button_layout.addWidget(self.start_button)
         button_layout.addWidget(self.pause_button)
+        button_layout.addWidget(self.instant_button)
         layout.addLayout(button_layout)
         
         self.setLayout(layout)
         
     def start_match(self):
-        self.timer.start(1000)  # Update every second
+        self.start_requested.emit()
         self.start_button.setEnabled(False)
         self.pause_button.setEnabled(True)
         
     def pause_match(self):
-        self.timer.stop()
+        self.pause_requested.emit()
         self.start_button.setEnabled(True)
         self.pause_button.setEnabled(False)
+
+    def instant_result(self):
+        self.fast_forward_requested.emit()
+        self.start_button.setEnabled(False)
+        self.pause_button.setEnabled(False)
+        self.instant_button.setEnabled(False)
         
-    def update_match(self):
-        event = self.match_engine.simulate_minute()
-        
+    def update_match(self, state):
         # Update time
-        self.time_label.setText(f"{self.match_engine.current_minute}'")
+        self.time_label.setText(f"{state['minute']}'")
         
         # Update score
-        self.home_score_label.setText(str(self.match_engine.home_score))
-        self.away_score_label.setText(str(self.match_engine.away_score))
+        self.home_score_label.setText(str(state["home_score"]))
+        self.away_score_label.setText(str(state["away_score"]))
         
         # Update possession
-        home_possession = self.match_engine.possession["home"]
+        home_possession = state["home_possession"]
         self.possession_bar.setValue(int(home_possession))
         self.possession_bar.setFormat(f"{home_possession:.1f}% - {100-home_possession:.1f}%")
-        
-        # Add event to list if one occurred
-        if event:
-            if event["event_type"] == "goal":
-                text = f"{event['minute']}' GOAL! {event['player_name']} ({event['team_name']}) - {event['details']['score']}"
-            else:
-                text = f"{event['minute']}' Shot by {event['player_name']} ({event['team_name']}) - {event['details']['outcome']}"
-            self.events_list.insertItem(0, text)
-        
-        # Check if match is over
-        if self.match_engine.current_minute >= 90:
-            self.timer.stop()
-            self.events_list.insertItem(0, "Match finished!")
-            self.start_button.setEnabled(False)
-            self.pause_button.setEnabled(False)
+
+    def add_event(self, event):
+        if event["event_type"] == "goal":
+            text = f"{event['minute']}' GOAL! {event['player_name']} ({event['team_name']}) - {event['details']['score']}"
+        else:
+            text = f"{event['minute']}' Shot by {event['player_name']} ({event['team_name']}) - {event['details']['outcome']}"
+        self.events_list.insertItem(0, text)
+
+    def finish_match(self, result):
+        self.events_list.insertItem(0, "Match finished!")
+        self.start_button.setEnabled(False)
+        self.pause_button.setEnabled(False)
+        self.instant_button.setEnabled(False)
+
+    def show_save_error(self, message):
+        self.events_list.insertItem(0, "Result not saved")
+        QMessageBox.warning(self, "Error", f"Failed to save match result: {message}")
@@ -0,0 +1,145 @@
+"""Incremental substring search for the list views.
+
+``SearchIndex`` lower-cases the searchable text once and keeps it as a
+fixed-width matrix of character codes, a 64-bit "which characters occur"
+mask per row, and a trigram index (sorted trigram keys with their row
+postings). A query first keeps rows holding all of its characters, then
+rows holding all of its trigrams, and only the survivors are verified
+against the code matrix. When a query extends the previous one, only the
+previous result is searched again.
+"""
+import numpy as np
+from PyQt5.QtCore import QTimer
+
+# Typing pauses shorter than this are merged into one search
+SEARCH_DELAY_MS = 150
+
+
+def debounce(line_edit, callback, delay_ms=SEARCH_DELAY_MS):
+    """Call ``callback`` once typing in ``line_edit`` pauses for ``delay_ms``"""
+    timer = QTimer(line_edit)
+    timer.setSingleShot(True)
+    timer.setInterval(delay_ms)
+    timer.timeout.connect(callback)
+    line_edit.textChanged.connect(timer.start)
+    return timer
+
+
+def _trigram_keys(codes):
+    codes = codes.astype(np.uint64)
+    return (codes[:, :-2] << np.uint64(42)) | (codes[:, 1:-1] << np.uint64(21)) | codes[:, 2:]
+
+
+class SearchIndex:
+    NGRAM = 3
+
+    def __init__(self, texts):
+        lowered = np.array([text.lower() for text in texts], dtype=str)
+        codes = lowered.view(np.uint32).reshape(len(lowered), max(lowered.itemsize // 4, 1))
+        # Most text is in the Basic Multilingual Plane, which halves memory
+        if codes.size and codes.max() < 0x10000:
+            codes = codes.astype(np.uint16)
+        # Column-major, so each character position is one contiguous array
+        codes = np.asfortranarray(codes)
+        self._codes = codes
+        self._all_rows = np.arange(len(lowered))
+
+        # The 63 most frequent characters get a bit each, the rest share one
+        counts = np.bincount(codes.ravel(), minlength=1) if codes.size else np.zeros(1, int)
+        counts[0] = 0  # padding
+        self._char_bits = np.full(len(counts), np.uint64(1) << np.uint64(63), dtype=np.uint64)
+        self._char_bits[0] = 0
+        frequent = np.argsort(counts)[::-1][:63]
+        frequent = frequent[counts[frequent] > 0]
+        self._char_bits[frequent] = np.uint64(1) << np.arange(len(frequent), dtype=np.uint64)
+        self._exact_bits = np.zeros(len(counts), dtype=bool)
+        self._exact_bits[frequent] = True
+        self._row_bits = np.zeros(len(lowered), dtype=np.uint64)
+        for column in range(codes.shape[1]):
+            self._row_bits |= self._char_bits[codes[:, column]]
+
+        if codes.shape[1] >= self.NGRAM:
+            keys = _trigram_keys(codes)
+            # Trailing zeros are padding, so skip trigrams that run into them
+            valid = codes[:, self.NGRAM - 1:] != 0
+            rows = np.broadcast_to(self._all_rows[:, None], keys.shape)[valid]
+            keys = keys[valid]
+            order = np.argsort(keys, kind="stable")
+            self._keys = keys[order]
+            self._postings = rows[order].astype(np.int32)
+        else:
+            self._keys = np.empty(0, dtype=np.uint64)
+            self._postings = np.empty(0, dtype=np.int32)
+
+        self._last_query = ""
+        self._last_rows = self._all_rows
+
+    def __len__(self):
+        return len(self._all_rows)
+
+    def search(self, query):
+        """Return the sorted row numbers whose text contains ``query``"""
+        query = query.lower()
+        if not query:
+            rows = self._all_rows
+        else:
+            query_codes = np.array([ord(char) for char in query], dtype=np.uint32)
+            if query_codes.max() >= len(self._char_bits) or len(query) > self._codes.shape[1]:
+                rows = self._all_rows[:0]
+            else:
+                # Narrow the previous result when the query extends it
+                query_bits = np.bitwise_or.reduce(self._char_bits[query_codes])
+                if self._last_query and self._last_query in query:
+                    candidates = self._last_rows
+                    candidates = candidates[(self._row_bits[candidates] & query_bits) == query_bits]
+                else:
+                    candidates = np.flatnonzero((self._row_bits & query_bits) == query_bits)
+
+                if len(query) == 1 and self._exact_bits[query_codes[0]]:
+                    # The character mask is already an exact match
+                    rows = candidates
+                elif len(query) >= self.NGRAM and len(candidates):
+                    candidates = candidates[self._trigram_mask(query_codes)[candidates]]
+                    # So is a single trigram
+                    if len(query) == self.NGRAM:
+                        rows = candidates
+                    else:
+                        rows = self._verify(candidates, query_codes.astype(self._codes.dtype))
+                else:
+                    rows = self._verify(candidates, query_codes.astype(self._codes.dtype))
+
+        self._last_query = query
+        self._last_rows = rows
+        return rows
+
+    def _trigram_mask(self, query_codes):
+        """Boolean row mask of the rows containing every trigram of the query"""
+        keys = _trigram_keys(query_codes[None, :])[0]
+        starts = np.searchsorted(self._keys, keys, side="left")
+        ends = np.searchsorted(self._keys, keys, side="right")
+        # Start from the rarest trigram, later ones can only remove rows
+        postings = sorted((self._postings[start:end] for start, end in zip(starts, ends)), key=len)
+
+        mask = np.zeros(len(self._all_rows), dtype=bool)
+        mask[postings[0]] = True
+        for posting in postings[1:]:
+            present = np.zeros_like(mask)
+            present[posting] = True
+            mask &= present
+        return mask
+
+    def _verify(self, rows, query_codes):
+        if not len(rows):
+            return rows
+        if len(rows) == len(self._all_rows):
+            columns = [self._codes[:, column] for column in range(self._codes.shape[1])]
+        else:
+            columns = [self._codes[:, column][rows] for column in range(self._codes.shape[1])]
+
+        found = np.zeros(len(rows), dtype=bool)
+        for start in range(len(columns) - len(query_codes) + 1):
+            match = columns[start] == query_codes[0]
+            for offset in range(1, len(query_codes)):
+                match &= columns[start + offset] == query_codes[offset]
+            found |= match
+        return rows[found]
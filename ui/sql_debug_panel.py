@@ -0,0 +1,89 @@
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTableWidget,
+                             QTableWidgetItem, QPushButton, QLabel, QHeaderView)
+from PyQt5.QtCore import Qt, QTimer
+from database.instrumentation import query_stats
+
+REFRESH_MS = 1000
+
+
+class SqlDebugPanel(QDialog):
+    """Live view of ``database.instrumentation.query_stats``"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("SQL Debug")
+        self.setMinimumSize(900, 500)
+        self.setup_ui()
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(REFRESH_MS)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.refresh_timer.start()
+        self.refresh()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+
+        self.totals_label = QLabel()
+        layout.addWidget(self.totals_label)
+
+        # Call sites, slowest first
+        self.sites_table = QTableWidget(0, 5)
+        self.sites_table.setHorizontalHeaderLabels(["Call Site", "Statements", "Failed", "Total ms", "Max ms"])
+        self.sites_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.sites_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.sites_table)
+
+        layout.addWidget(QLabel("Possible N+1 queries:"))
+        self.n_plus_one_table = QTableWidget(0, 3)
+        self.n_plus_one_table.setHorizontalHeaderLabels(["Call Site", "Statements", "SQL"])
+        self.n_plus_one_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
+        self.n_plus_one_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.n_plus_one_table)
+
+        button_layout = QHBoxLayout()
+        reset_btn = QPushButton("Reset")
+        reset_btn.clicked.connect(self.reset)
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.close)
+        button_layout.addWidget(reset_btn)
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+
+    def refresh(self):
+        snapshot = query_stats.snapshot()
+        self.totals_label.setText(
+            f"{snapshot['statements']} statements ({snapshot['failures']} failed), "
+            f"{snapshot['seconds'] * 1000:.1f} ms in total"
+        )
+
+        self.sites_table.setRowCount(len(snapshot["call_sites"]))
+        for row, (site, stats) in enumerate(snapshot["call_sites"].items()):
+            self.set_row(self.sites_table, row, [
+                site,
+                stats["statements"],
+                stats["failures"],
+                stats["seconds"] * 1000,
+                stats["max_seconds"] * 1000,
+            ])
+
+        self.n_plus_one_table.setRowCount(len(snapshot["n_plus_one"]))
+        for row, finding in enumerate(snapshot["n_plus_one"]):
+            self.set_row(self.n_plus_one_table, row, [
+                finding["call_site"],
+                finding["statements"],
+                " ".join(finding["statement"].split()),
+            ])
+
+    def set_row(self, table, row, values):
+        for column, value in enumerate(values):
+            if isinstance(value, str):
+                item = QTableWidgetItem(value)
+            else:
+                item = QTableWidgetItem(f"{value:.2f}" if isinstance(value, float) else str(value))
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            table.setItem(row, column, item)
+
+    def reset(self):
+        query_stats.reset()
+        self.refresh()
@@ -0,0 +1,132 @@
+import numpy as np
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QColor
+from .search import SearchIndex
+
+COLUMNS = ["Name", "Position", "Age", "Attack", "Defense", "Stamina", "Speed", "Technique"]
+NUMERIC_FIELDS = ["age", "attack", "defense", "stamina", "speed", "technique"]
+FIRST_STAT_COLUMN = 3
+
+# Shared brushes for the stat colour bands
+GOOD_COLOR = QColor("#27ae60")  # Good (green)
+MEDIUM_COLOR = QColor("#f39c12")  # Medium (orange)
+POOR_COLOR = QColor("#c0392b")  # Poor (red)
+
+
+class SquadTableModel(QAbstractTableModel):
+    """Table model over a columnar (NumPy) copy of the player rows.
+
+    Name search goes through a ``SearchIndex`` built once per load;
+    position filtering and sorting are array operations on an index of
+    visible rows, so views only ask for the handful of cells on screen and
+    no per-row Python objects are created.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.set_players([])
+
+    def set_players(self, rows):
+        """Replace the data with ``(id, name, position, age, attack, ...)`` rows"""
+        self.beginResetModel()
+        self._ids = np.array([row[0] for row in rows], dtype=np.int64)
+        self._names = np.array([row[1] or "" for row in rows], dtype=object)
+        self._lower_names = np.array([name.lower() for name in self._names], dtype=str)
+        self._search_index = SearchIndex(list(self._names))
+        self._positions = np.array([row[2] or "" for row in rows], dtype=object)
+        self._values = np.array(
+            [[value or 0 for value in row[3:]] for row in rows], dtype=np.int64
+        ).reshape(len(rows), len(NUMERIC_FIELDS))
+        self._search_text = ""
+        self._position = None
+        self._sort_column = None
+        self._sort_order = Qt.AscendingOrder
+        self._rows = np.arange(len(rows))
+        self.endResetModel()
+
+    def set_filter(self, search_text="", position=None):
+        """Show only players whose name contains ``search_text`` and who play ``position``"""
+        self._search_text = search_text
+        self._position = position
+        self.beginResetModel()
+        self._rows = self._sorted(self._filtered())
+        self.endResetModel()
+
+    def _filtered(self):
+        rows = self._search_index.search(self._search_text)
+        if self._position:
+            rows = rows[self._positions[rows] == self._position]
+        return rows
+
+    def _sorted(self, rows):
+        if self._sort_column is None or not len(rows):
+            return rows
+        if self._sort_column == 0:
+            keys = self._lower_names[rows]
+        elif self._sort_column == 1:
+            keys = self._positions[rows].astype(str)
+        else:
+            keys = self._values[rows, self._sort_column - 2]
+        order = np.argsort(keys, kind="stable")
+        if self._sort_order == Qt.DescendingOrder:
+            order = order[::-1]
+        return rows[order]
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        self._sort_column = column if column >= 0 else None
+        self._sort_order = order
+        old_rows = self._rows
+        self._rows = self._sorted(old_rows)
+        # Move selections and the current index along with their players
+        new_position = {int(player): position for position, player in enumerate(self._rows)}
+        persistent = self.persistentIndexList()
+        self.changePersistentIndexList(persistent, [
+            self.index(new_position[int(old_rows[index.row()])], index.column())
+            for index in persistent
+        ])
+        self.layoutChanged.emit()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return self._names[row]
+            if column == 1:
+                return self._positions[row]
+            return str(self._values[row, column - 2])
+        if role == Qt.ForegroundRole and column >= FIRST_STAT_COLUMN:
+            stat_value = self._values[row, column - 2]
+            if stat_value >= 80:
+                return GOOD_COLOR
+            if stat_value >= 60:
+                return MEDIUM_COLOR
+            return POOR_COLOR
+        if role == Qt.UserRole:
+            return int(self._ids[row])
+        return None
+
+    def player_id(self, row):
+        """Database id of the player shown in ``row``"""
+        return int(self._ids[self._rows[row]])
+
+    def averages(self):
+        """Mean of every numeric field over all loaded players"""
+        if not len(self._ids):
+            return None
+        return dict(zip(NUMERIC_FIELDS, self._values.mean(axis=0)))
@@ -1,19 +1,13 @@
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
-                           QTableWidgetItem, QPushButton, QLabel, QComboBox,
-                           QHeaderView, QMessageBox, QLineEdit)
-from PyQt5.QtCore import Qt, pyqtSlot
-from PyQt5.QtGui import QColor
-from database import get_session, Player, Team
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableView,
+                           QPushButton, QLabel, QComboBox,
+                           QHeaderView, QMessageBox, QLineEdit, QAbstractItemView)
+from sqlalchemy import select
+from database import get_session, Player
+from logic.ratings_cache import ratings_cache
 from .player_dialog import PlayerDialog
-
-class SortableTableWidgetItem(QTableWidgetItem):
-    def __lt__(self, other):
-        if isinstance(self.data(Qt.DisplayRole), str) and isinstance(other.data(Qt.DisplayRole), str):
-            return self.data(Qt.DisplayRole).lower() < other.data(Qt.DisplayRole).lower()
-        try:
-            return float(self.data(Qt.DisplayRole)) < float(other.data(Qt.DisplayRole))
-        except ValueError:
-            return super().__lt__(other)
+from .squad_model import SquadTableModel
+from .search import debounce
+from .team_models import TeamListModel
 
 class SquadView(QWidget):
     def __init__(self):
@@ -44,7 +38,7 @@ class SquadView(QWidget):
         search_label.setProperty("class", "section-label")
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("Search players...")
-        self.search_edit.textChanged.connect(self.filter_squad_data)
+        debounce(self.search_edit, self.filter_squad_data)
         search_layout.addWidget(search_label)
         search_layout.addWidget(self.search_edit)
         top_layout.addLayout(search_layout)
@@ -63,12 +57,11 @@ class SquadView(QWidget):
         layout.addLayout(top_layout)
         
         # Squad table
-        self.squad_table = QTableWidget()
-        self.squad_table.setColumnCount(8)
-        self.squad_table.setHorizontalHeaderLabels([
-            "Name", "Position", "Age", "Attack", "Defense",
-            "Stamina", "Speed", "Technique"
-        ])
+        self.squad_model = SquadTableModel(self)
+        self.squad_table = QTableView()
+        self.squad_table.setModel(self.squad_model)
+        self.squad_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.squad_table.verticalHeader().setDefaultSectionSize(24)
         
         # Enable sorting
         self.squad_table.setSortingEnabled(True)
@@ -107,100 +100,61 @@ class SquadView(QWidget):
         self.add_player_btn.clicked.connect(self.add_player)
         self.edit_player_btn.clicked.connect(self.edit_player)
         self.remove_player_btn.clicked.connect(self.remove_player)
-        self.squad_table.itemSelectionChanged.connect(self.update_button_states)
+        self.squad_model.modelReset.connect(self.update_button_states)
+        self.squad_table.selectionModel().selectionChanged.connect(self.update_button_states)
         
         self.update_button_states()
 
     def load_teams(self):
-        teams = self.session.query(Team).all()
-        for team in teams:
-            self.team_combo.addItem(team.name, team.id)
+        self.team_combo.setModel(TeamListModel(self.session, self.team_combo))
 
     def load_squad_data(self):
         team_id = self.team_combo.currentData()
         if team_id is None:
             return
             
-        self.current_players = self.session.query(Player).filter_by(team_id=team_id).all()
+        # Plain column tuples are enough for the table, no ORM objects needed
+        rows = self.session.execute(
+            select(Player.id, Player.name, Player.position, Player.age, Player.attack,
+                   Player.defense, Player.stamina, Player.speed, Player.technique)
+            .where(Player.team_id == team_id)
+        ).all()
+        self.squad_model.set_players(rows)
+        header = self.squad_table.horizontalHeader()
+        self.squad_model.sort(header.sortIndicatorSection(), header.sortIndicatorOrder())
         self.filter_squad_data()
         self.update_squad_stats()
 
     def filter_squad_data(self):
-        if not hasattr(self, 'current_players'):
-            return
-            
-        search_text = self.search_edit.text().lower()
         position_filter = self.position_filter.currentText()
-        
-        filtered_players = []
-        for player in self.current_players:
-            # Apply search filter
-            if search_text and search_text not in player.name.lower():
-                continue
-                
-            # Apply position filter
-            if position_filter != "All" and player.position != position_filter:
-                continue
-                
-            filtered_players.append(player)
-        
-        self.squad_table.setRowCount(len(filtered_players))
-        for row, player in enumerate(filtered_players):
-            # Name with colored stats
-            name_item = SortableTableWidgetItem(player.name)
-            name_item.setData(Qt.UserRole, player.id)
-            
-            # Create items
-            items = [
-                name_item,
-                SortableTableWidgetItem(player.position),
-                SortableTableWidgetItem(str(player.age)),
-                SortableTableWidgetItem(str(player.attack)),
-                SortableTableWidgetItem(str(player.defense)),
-                SortableTableWidgetItem(str(player.stamina)),
-                SortableTableWidgetItem(str(player.speed)),
-                SortableTableWidgetItem(str(player.technique))
-            ]
-            
-            # Set items with color based on stats
-            for col, item in enumerate(items):
-                self.squad_table.setItem(row, col, item)
-                if col >= 3:  # Stats columns
-                    stat_value = int(item.text())
-                    if stat_value >= 80:
-                        item.setForeground(QColor("#27ae60"))  # Good (green)
-                    elif stat_value >= 60:
-                        item.setForeground(QColor("#f39c12"))  # Medium (orange)
-                    else:
-                        item.setForeground(QColor("#c0392b"))  # Poor (red)
+        self.squad_model.set_filter(
+            self.search_edit.text(),
+            None if position_filter == "All" else position_filter
+        )
 
     def update_squad_stats(self):
-        if not hasattr(self, 'current_players') or not self.current_players:
+        averages = self.squad_model.averages()
+        if not averages:
             self.squad_stats_label.setText("")
             return
             
-        avg_attack = sum(p.attack for p in self.current_players) / len(self.current_players)
-        avg_defense = sum(p.defense for p in self.current_players) / len(self.current_players)
-        avg_stamina = sum(p.stamina for p in self.current_players) / len(self.current_players)
-        
-        stats_text = (f"Squad Stats - Attack: {avg_attack:.1f} | "
-                     f"Defense: {avg_defense:.1f} | "
-                     f"Stamina: {avg_stamina:.1f}")
+        stats_text = (f"Squad Stats - Attack: {averages['attack']:.1f} | "
+                     f"Defense: {averages['defense']:.1f} | "
+                     f"Stamina: {averages['stamina']:.1f}")
         self.squad_stats_label.setText(stats_text)
 
     def update_button_states(self):
-        has_selection = len(self.squad_table.selectedItems()) > 0
+        has_selection = self.squad_table.selectionModel().hasSelection()
         self.edit_player_btn.setEnabled(has_selection)
         self.remove_player_btn.setEnabled(has_selection)
 
     def get_selected_player(self):
-        selected_items = self.squad_table.selectedItems()
-        if not selected_items:
+        selected_rows = self.squad_table.selectionModel().selectedRows()
+        if not selected_rows:
             return None
         
-        row = selected_items[0].row()
-        player_id = self.squad_table.item(row, 0).data(Qt.UserRole)
-        return self.session.query(Player).get(player_id)
+        player_id = self.squad_model.player_id(selected_rows[0].row())
+        return self.session.get(Player, player_id)
 
     def add_player(self):
         team_id = self.team_combo.currentData()
@@ -215,6 +169,7 @@ class SquadView(QWidget):
             
             self.session.add(player)
             self.session.commit()
+            ratings_cache.invalidate(team_id)
             self.load_squad_data()
 
     def edit_player(self):
@@ -229,6 +184,7 @@ class SquadView(QWidget):
                 setattr(player, key, value)
             
             self.session.commit()
+            ratings_cache.invalidate(player.team_id)
             self.load_squad_data()
 
     def remove_player(self):
@@ -245,6 +201,8 @@ class SquadView(QWidget):
         )
         
         if reply == QMessageBox.Yes:
+            team_id = player.team_id
             self.session.delete(player)
             self.session.commit()
+            ratings_cache.invalidate(team_id)
             self.load_squad_data()
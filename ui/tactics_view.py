@@ -17,6 +17,9 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt, QRectF, QPointF
 from PyQt5.QtGui import QPen, QBrush, QColor
 from database import get_session, Player, Team, TeamTactics
+from logic.ratings_cache import ratings_cache
+from logic.tactics import FORMATIONS
+from .team_models import TeamListModel
 
 
 class PlayerItem(QGraphicsEllipseItem):
@@ -174,112 +177,8 @@ class PitchView(QGraphicsView):
 
 
 class TacticsView(QWidget):
-    FORMATIONS = {
-        "4-4-2": [
-            # Strikers
-            [(600, 150), (600, 350)],
-            # Midfielders
-            [(450, 100), (450, 200), (450, 300), (450, 400)],
-            # Defenders
-            [(200, 100), (200, 200), (200, 300), (200, 400)],
-            # Goalkeeper
-            [(80, 250)],
-        ],
-        "4-4-2 Diamond": [
-            # Strikers
-            [(600, 150), (600, 350)],
-            # Midfielders (Diamond: CAM, 2xCM, CDM)
-            [(500, 250), (450, 150), (450, 350), (400, 250)],
-            # Defenders
-            [(200, 100), (200, 200), (200, 300), (200, 400)],
-            # Goalkeeper
-            [(80, 250)],
-        ],
-        "4-3-3": [
-            # Strikers
-            [(600, 150), (600, 250), (600, 350)],
-            # Midfielders
-            [(450, 150), (450, 250), (450, 350)],
-            # Defenders
-            [(200, 100), (200, 200), (200, 300), (200, 400)],
-            # Goalkeeper
-            [(80, 250)],
-        ],
-        "4-3-3 Holding": [
-            # Strikers
-            [(600, 150), (600, 250), (600, 350)],
-            # Midfielders (2 CM, 1 CDM)
-            [(500, 175), (500, 325), (400, 250)],
-            # Defenders
-            [(200, 100), (200, 200), (200, 300), (200, 400)],
-            # Goalkeeper
-            [(80, 250)],
-        ],
-        "4-2-3-1": [
-            # Striker
-            [(600, 250)],
-            # Attacking Midfielders
-            [(500, 150), (500, 250), (500, 350)],
-            # Defensive Midfielders
-            [(400, 175), (400, 325)],
-            # Defenders
-            [(200, 100), (200, 200), (200, 300), (200, 400)],
-            # Goalkeeper
-            [(80, 250)],
-        ],
-        "3-5-2": [
-            # Strikers
-            [(600, 150), (600, 350)],
-            # Midfielders
-            [(450, 100), (450, 175), (450, 250), (450, 325), (450, 400)],
-            # Defenders
-            [(200, 150), (200, 250), (200, 350)],
-            # Goalkeeper
-            [(80, 250)],
-        ],
-        "3-4-3": [
-            # Strikers
-            [(600, 150), (600, 250), (600, 350)],
-            # Midfielders
-            [(450, 125), (450, 225), (450, 325), (450, 425)],
-            # Defenders
-            [(200, 150), (200, 250), (200, 350)],
-            # Goalkeeper
-            [(80, 250)],
-        ],
-        "5-3-2": [
-            # Strikers
-            [(600, 150), (600, 350)],
-            # Midfielders
-            [(450, 150), (450, 250), (450, 350)],
-            # Defenders
-            [(200, 50), (200, 150), (200, 250), (200, 350), (200, 450)],
-            # Goalkeeper
-            [(80, 250)],
-        ],
-        "4-5-1": [
-            # Striker
-            [(600, 250)],
-            # Midfielders
-            [(450, 50), (450, 150), (450, 250), (450, 350), (450, 450)],
-            # Defenders
-            [(200, 100), (200, 200), (200, 300), (200, 400)],
-            # Goalkeeper
-            [(80, 250)],
-        ],
-        "4-1-4-1": [
-            # Striker
-            [(600, 250)],
-            # Advanced Midfielders
-            [(500, 100), (500, 200), (500, 300), (500, 400)],
-            # Defensive Midfielder
-            [(400, 250)],
-            # Defenders
-            [(200, 100), (200, 200), (200, 300), (200, 400)],
-            # Goalkeeper
-            [(80, 250)],
-        ],
-    }
+    # Pitch layouts live in logic.tactics so the engines can use them too
+    FORMATIONS = FORMATIONS
 
     def __init__(self):
         super().__init__()
@@ -360,10 +259,7 @@ class TacticsView(QWidget):
         self.update_formation()
 
     def load_teams(self):
-        self.team_combo.clear()
-        teams = self.session.query(Team).all()
-        for team in teams:
-            self.team_combo.addItem(team.name, team.id)
+        self.team_combo.setModel(TeamListModel(self.session, self.team_combo))
         self.team_combo.currentIndexChanged.connect(self.load_squad)
 
     def load_squad(self):
@@ -484,6 +380,7 @@ class TacticsView(QWidget):
             self.current_tactics.player_roles = player_roles
             try:
                 self.session.commit()
+                ratings_cache.invalidate(self.current_tactics.team_id)
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to save roles: {str(e)}")
 
@@ -535,6 +432,7 @@ class TacticsView(QWidget):
 
         try:
             self.session.commit()
+            ratings_cache.invalidate(tactics.team_id)
             self.current_tactics = tactics
             self.load_saved_tactics()
             # Select the saved tactics
@@ -564,6 +462,7 @@ class TacticsView(QWidget):
                 tactics = self.session.query(TeamTactics).get(tactics_id)
                 self.session.delete(tactics)
                 self.session.commit()
+                ratings_cache.invalidate(tactics.team_id)
                 self.load_saved_tactics()
                 self.tactics_combo.setCurrentIndex(0)  # Select "New Tactics"
                 QMessageBox.information(
@@ -0,0 +1,174 @@
+from PyQt5.QtCore import Qt, QAbstractListModel, QAbstractTableModel, QModelIndex
+from sqlalchemy import select
+from database import Team
+from database.paging import keyset_page
+from .search import SearchIndex
+
+
+class TeamListModel(QAbstractListModel):
+    """Team names for combo boxes, loaded a page at a time as the list scrolls.
+
+    ``QComboBox.currentData()`` returns the team id.
+    """
+
+    def __init__(self, session, parent=None):
+        super().__init__(parent)
+        self.session = session
+        self.reload()
+
+    def reload(self):
+        self.beginResetModel()
+        self._rows = []
+        self._exhausted = False
+        self.endResetModel()
+        self.fetchMore()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted:
+            return
+        after = (self._rows[-1][0],) if self._rows else None
+        page = keyset_page(self.session, [Team.id, Team.name], Team.id, after=after)
+        self._exhausted = len(page) == 0
+        if page:
+            self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows) + len(page) - 1)
+            self._rows.extend((row[0], row[1]) for row in page)
+            self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        team_id, name = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return name
+        if role == Qt.UserRole:
+            return team_id
+        return None
+
+
+class TeamTableModel(QAbstractTableModel):
+    """Teams table for TeamView.
+
+    Browsing pages through the database with keyset pagination in the
+    current sort order. Searching needs every team's text, so the first
+    search loads the searchable columns once (as plain rows, not ORM
+    objects) and builds a ``SearchIndex``; matches are then served from it.
+    """
+    COLUMNS = [
+        ("Team Name", Team.name),
+        ("Country", Team.country),
+        ("League", Team.league),
+        ("Budget", Team.budget),
+    ]
+
+    def __init__(self, session, parent=None):
+        super().__init__(parent)
+        self.session = session
+        self._sort_column = 0
+        self._sort_order = Qt.AscendingOrder
+        self._search_text = ""
+        self._all_rows = None
+        self._search_index = None
+        self.reload()
+
+    def reload(self):
+        """Drop all loaded rows, e.g. after teams were added or edited"""
+        self._all_rows = None
+        self._search_index = None
+        # Rebuilds the search index first if a search is active
+        self.set_search(self._search_text)
+
+    def _refresh(self):
+        self.beginResetModel()
+        self._exhausted = False
+        if self._search_text:
+            rows = [self._all_rows[index] for index in self._search_index.search(self._search_text)]
+            rows.sort(key=self._sort_key, reverse=self._sort_order == Qt.DescendingOrder)
+            self._rows = rows
+            self._exhausted = True
+        else:
+            self._rows = []
+        self.endResetModel()
+        self.fetchMore()
+
+    def _sort_key(self, row):
+        # Same order as the database pages: NULLs as ''/0, then by id
+        value = row[self._sort_column + 1]
+        if self.COLUMNS[self._sort_column][1] is Team.budget:
+            return (value or 0, row[0])
+        return (value or "", row[0])
+
+    def set_search(self, text):
+        self._search_text = text
+        if text and self._search_index is None:
+            self._all_rows = [
+                tuple(row) for row in self.session.execute(
+                    select(Team.id, Team.name, Team.country, Team.league, Team.budget)
+                ).all()
+            ]
+            self._search_index = SearchIndex([
+                f"{name}\n{country or ''}\n{league or ''}"
+                for _, name, country, league, _ in self._all_rows
+            ])
+        self._refresh()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        if column < 0:
+            return
+        self._sort_column = column
+        self._sort_order = order
+        self._refresh()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted:
+            return
+        sort_column = self.COLUMNS[self._sort_column][1]
+        after = (self._rows[-1][-1], self._rows[-1][0]) if self._rows else None
+        page = keyset_page(
+            self.session,
+            [Team.id, Team.name, Team.country, Team.league, Team.budget],
+            Team.id,
+            sort_column=sort_column,
+            after=after,
+            descending=self._sort_order == Qt.DescendingOrder,
+        )
+        self._exhausted = len(page) == 0
+        if page:
+            self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows) + len(page) - 1)
+            self._rows.extend(tuple(row) for row in page)
+            self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section][0]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            value = row[index.column() + 1]
+            if index.column() == 3:
+                return f"${value or 0:,.2f}"
+            return value
+        if role == Qt.UserRole:
+            return row[0]
+        return None
+
+    def team_id(self, row):
+        return self._rows[row][0]
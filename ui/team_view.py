@@ -1,16 +1,16 @@
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
-                           QTableWidgetItem, QPushButton, QLabel, QLineEdit,
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableView,
+                           QPushButton, QLabel, QLineEdit, QAbstractItemView,
                            QHeaderView, QMessageBox)
-from PyQt5.QtCore import Qt
 from database import get_session, Team
 from .team_dialog import TeamDialog
+from .search import debounce
+from .team_models import TeamTableModel
 
 class TeamView(QWidget):
     def __init__(self):
         super().__init__()
         self.session = get_session()
         self.setup_ui()
-        self.load_teams()
 
     def setup_ui(self):
         layout = QVBoxLayout(self)
@@ -20,17 +20,16 @@ class TeamView(QWidget):
         search_label = QLabel("Search Teams:")
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("Search by name, country, or league...")
-        self.search_edit.textChanged.connect(self.filter_teams)
+        debounce(self.search_edit, self.filter_teams)
         search_layout.addWidget(search_label)
         search_layout.addWidget(self.search_edit)
         layout.addLayout(search_layout)
         
-        # Teams table
-        self.teams_table = QTableWidget()
-        self.teams_table.setColumnCount(4)
-        self.teams_table.setHorizontalHeaderLabels([
-            "Team Name", "Country", "League", "Budget"
-        ])
+        # Teams table, filled page by page as it scrolls
+        self.teams_model = TeamTableModel(self.session, self)
+        self.teams_table = QTableView()
+        self.teams_table.setModel(self.teams_model)
+        self.teams_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         
         # Enable sorting
         self.teams_table.setSortingEnabled(True)
@@ -62,57 +61,32 @@ class TeamView(QWidget):
         layout.addLayout(button_layout)
         
         # Update button states
-        self.teams_table.itemSelectionChanged.connect(self.update_button_states)
+        self.teams_model.modelReset.connect(self.update_button_states)
+        self.teams_table.selectionModel().selectionChanged.connect(self.update_button_states)
         self.update_button_states()
 
     def load_teams(self):
-        """Load all teams into the table"""
-        self.teams = self.session.query(Team).all()
-        self.filter_teams()
+        """Reload the teams table from the database"""
+        self.teams_model.reload()
 
     def filter_teams(self):
         """Filter teams based on search text"""
-        search_text = self.search_edit.text().lower()
-        
-        self.teams_table.setRowCount(0)
-        for team in self.teams:
-            if (search_text in team.name.lower() or
-                search_text in team.country.lower() or
-                search_text in team.league.lower()):
-                
-                row = self.teams_table.rowCount()
-                self.teams_table.insertRow(row)
-                
-                # Create items
-                items = [
-                    QTableWidgetItem(team.name),
-                    QTableWidgetItem(team.country),
-                    QTableWidgetItem(team.league),
-                    QTableWidgetItem(f"${team.budget:,.2f}")
-                ]
-                
-                # Store team ID in the first column
-                items[0].setData(Qt.UserRole, team.id)
-                
-                # Set items
-                for col, item in enumerate(items):
-                    self.teams_table.setItem(row, col, item)
+        self.teams_model.set_search(self.search_edit.text())
 
     def update_button_states(self):
         """Enable/disable buttons based on selection"""
-        has_selection = len(self.teams_table.selectedItems()) > 0
+        has_selection = self.teams_table.selectionModel().hasSelection()
         self.edit_team_btn.setEnabled(has_selection)
         self.remove_team_btn.setEnabled(has_selection)
 
     def get_selected_team(self):
         """Get the currently selected team"""
-        selected_items = self.teams_table.selectedItems()
-        if not selected_items:
+        selected_rows = self.teams_table.selectionModel().selectedRows()
+        if not selected_rows:
             return None
         
-        row = selected_items[0].row()
-        team_id = self.teams_table.item(row, 0).data(Qt.UserRole)
-        return self.session.query(Team).get(team_id)
+        team_id = self.teams_model.team_id(selected_rows[0].row())
+        return self.session.get(Team, team_id)
 
     def add_team(self):
         """Add a new team"""